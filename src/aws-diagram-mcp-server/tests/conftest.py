@@ -12,16 +12,15 @@
 """Test fixtures for the diagrams-mcp-server tests."""
 
 import pytest
-import tempfile
 from awslabs.aws_diagram_mcp_server.models import DiagramType
-from typing import Dict, Generator
+from pathlib import Path
+from typing import Dict
 
 
 @pytest.fixture
-def temp_workspace_dir() -> Generator[str, None, None]:
+def temp_workspace_dir(tmp_path: Path) -> str:
     """Create a temporary directory for diagram output."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -31,14 +31,18 @@ class TestDiagramType:
 
     def test_diagram_type_values(self):
         """Test that DiagramType enum has the expected values."""
-        assert DiagramType.AWS == 'aws'
-        assert DiagramType.SEQUENCE == 'sequence'
-        assert DiagramType.FLOW == 'flow'
-        assert DiagramType.CLASS == 'class'
-        assert DiagramType.K8S == 'k8s'
-        assert DiagramType.ONPREM == 'onprem'
-        assert DiagramType.CUSTOM == 'custom'
-        assert DiagramType.ALL == 'all'
+        expected = {
+            'AWS': 'aws',
+            'SEQUENCE': 'sequence',
+            'FLOW': 'flow',
+            'CLASS': 'class',
+            'K8S': 'k8s',
+            'ONPREM': 'onprem',
+            'CUSTOM': 'custom',
+            'ALL': 'all',
+        }
+        actual = {member.name: member.value for member in DiagramType}
+        assert expected.items() <= actual.items()
 
     def test_diagram_type_from_string(self):
         """Test that DiagramType can be created from strings."""
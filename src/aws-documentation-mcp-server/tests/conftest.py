@@ -13,6 +13,24 @@
 import pytest
 
 
+class MockContext:
+    """Mock context for testing."""
+
+    async def error(self, message):
+        """Mock error method."""
+        print(f'Error: {message}')
+
+
+@pytest.fixture(scope='session')
+def ctx():
+    """Provide a mock MCP context shared by all tool tests.
+
+    The mock only prints the errors it receives and keeps no state, so one instance can be
+    reused for the whole session.
+    """
+    return MockContext()
+
+
 def pytest_addoption(parser):
     """Add command-line options to pytest."""
     parser.addoption(
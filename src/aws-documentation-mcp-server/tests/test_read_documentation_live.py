@@ -14,21 +14,12 @@ import pytest
 from awslabs.aws_documentation_mcp_server.server import read_documentation
 
 
-class MockContext:
-    """Mock context for testing."""
-
-    async def error(self, message):
-        """Mock error method."""
-        print(f'Error: {message}')
-
-
 @pytest.mark.asyncio
 @pytest.mark.live
-async def test_read_documentation_live():
+async def test_read_documentation_live(ctx):
     """Test that read_documentation can fetch real AWS documentation."""
     # Use a stable AWS documentation URL that's unlikely to change
     url = 'https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucketnamingrules.html'
-    ctx = MockContext()
 
     # Call the tool
     result = await read_documentation(ctx, url=url, max_length=5000, start_index=0)
@@ -62,11 +53,10 @@ async def test_read_documentation_live():
 
 @pytest.mark.asyncio
 @pytest.mark.live
-async def test_read_documentation_pagination_live():
+async def test_read_documentation_pagination_live(ctx):
     """Test that read_documentation pagination works correctly."""
     # Use a stable AWS documentation URL that's likely to have substantial content
     url = 'https://docs.aws.amazon.com/AmazonS3/latest/userguide/Welcome.html'
-    ctx = MockContext()
 
     # Create parameters for the tool with a small max_length to force pagination
     small_max_length = 1000
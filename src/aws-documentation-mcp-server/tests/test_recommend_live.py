@@ -15,21 +15,12 @@ import pytest
 from awslabs.aws_documentation_mcp_server.server import recommend
 
 
-class MockContext:
-    """Mock context for testing."""
-
-    async def error(self, message):
-        """Mock error method."""
-        print(f'Error: {message}')
-
-
 @pytest.mark.asyncio
 @pytest.mark.live
-async def test_recommend_live():
+async def test_recommend_live(ctx):
     """Test the recommend tool with a live API call."""
     # Use a real AWS documentation URL
     url = 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/concepts.html'
-    ctx = MockContext()
 
     # Call the recommend function
     results = await recommend(ctx, url=url)
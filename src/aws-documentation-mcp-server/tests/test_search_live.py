@@ -15,21 +15,12 @@ import pytest
 from awslabs.aws_documentation_mcp_server.server import search_documentation
 
 
-class MockContext:
-    """Mock context for testing."""
-
-    async def error(self, message):
-        """Mock error method."""
-        print(f'Error: {message}')
-
-
 @pytest.mark.asyncio
 @pytest.mark.live
-async def test_search_documentation_live():
+async def test_search_documentation_live(ctx):
     """Test the search_documentation tool with a live API call."""
     # Use a search phrase that should return results
     search_phrase = 'S3 bucket naming rules'
-    ctx = MockContext()
 
     # Call the search_documentation function
     results = await search_documentation(ctx, search_phrase=search_phrase, limit=5)
@@ -58,11 +49,10 @@ async def test_search_documentation_live():
 
 @pytest.mark.asyncio
 @pytest.mark.live
-async def test_search_documentation_empty_results():
+async def test_search_documentation_empty_results(ctx):
     """Test the search_documentation tool with a search phrase that should return few or no results."""
     # Use a very specific search phrase that might not have many results
     search_phrase = 'xyzabcnonexistentdocumentationterm123456789'
-    ctx = MockContext()
 
     # Call the search_documentation function
     results = await search_documentation(ctx, search_phrase=search_phrase, limit=5)
@@ -84,10 +74,9 @@ async def test_search_documentation_empty_results():
 
 @pytest.mark.asyncio
 @pytest.mark.live
-async def test_search_documentation_limit():
+async def test_search_documentation_limit(ctx):
     """Test the search_documentation tool with different limit values."""
     search_phrase = 'AWS Lambda'
-    ctx = MockContext()
 
     # Test with limit=3
     results_small = await search_documentation(ctx, search_phrase=search_phrase, limit=3)
@@ -21,14 +21,6 @@ from awslabs.aws_documentation_mcp_server.util import extract_content_from_html
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
-class MockContext:
-    """Mock context for testing."""
-
-    async def error(self, message):
-        """Mock error method."""
-        print(f'Error: {message}')
-
-
 class TestExtractContentFromHTML:
     """Tests for the extract_content_from_html function."""
 
@@ -61,10 +53,9 @@ class TestReadDocumentation:
     """Tests for the read_documentation function."""
 
     @pytest.mark.asyncio
-    async def test_read_documentation(self):
+    async def test_read_documentation(self, ctx):
         """Test reading AWS documentation."""
         url = 'https://docs.aws.amazon.com/test.html'
-        ctx = MockContext()
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -86,10 +77,9 @@ class TestReadDocumentation:
                 mock_extract.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_read_documentation_error(self):
+    async def test_read_documentation_error(self, ctx):
         """Test reading AWS documentation with an error."""
         url = 'https://docs.aws.amazon.com/test.html'
-        ctx = MockContext()
 
         with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_get.side_effect = httpx.HTTPError('Connection error')
@@ -105,10 +95,9 @@ class TestSearchDocumentation:
     """Tests for the search_documentation function."""
 
     @pytest.mark.asyncio
-    async def test_search_documentation(self):
+    async def test_search_documentation(self, ctx):
         """Test searching AWS documentation."""
         search_phrase = 'test'
-        ctx = MockContext()
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -152,10 +141,9 @@ class TestRecommend:
     """Tests for the recommend function."""
 
     @pytest.mark.asyncio
-    async def test_recommend(self):
+    async def test_recommend(self, ctx):
         """Test getting content recommendations."""
         url = 'https://docs.aws.amazon.com/test'
-        ctx = MockContext()
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -17,6 +17,7 @@ from awslabs.aws_documentation_mcp_server.util import (
     is_html_content,
     parse_recommendation_results,
 )
+from pathlib import Path
 from unittest.mock import patch
 
 
@@ -154,8 +155,7 @@ class TestExtractContentFromHtml:
         test_file_path = os.path.join(
             os.path.dirname(__file__), 'resources', 'lambda_sns_raw.html'
         )
-        with open(test_file_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        html_content = Path(test_file_path).read_text(encoding='utf-8')
 
         # Extract content
         markdown_content = extract_content_from_html(html_content)
@@ -138,6 +138,42 @@ geo_places_client = GeoPlacesClient()
 geo_routes_client = GeoRoutesClient()
 
 
+def _parse_contacts(contacts: Dict) -> Dict:
+    """Flatten a geo-places Contacts structure into lists of phone, website, email and fax values."""
+    return {
+        'phones': [p['Value'] for p in contacts.get('Phones', [])] if contacts else [],
+        'websites': [w['Value'] for w in contacts.get('Websites', [])] if contacts else [],
+        'emails': [e['Value'] for e in contacts.get('Emails', [])] if contacts else [],
+        'faxes': [f['Value'] for f in contacts.get('Faxes', [])] if contacts else [],
+    }
+
+
+def _parse_opening_hours(result: Dict) -> list:
+    """Normalize the opening hours of a geo-places result into a list of dicts."""
+    oh = result.get('OpeningHours')
+    if not oh:
+        contacts = result.get('Contacts', {})
+        oh = contacts.get('OpeningHours') if contacts else None
+    if not oh:
+        return []
+    # Normalize to list of dicts with display and components
+    if isinstance(oh, dict):
+        oh = [oh]
+    parsed = []
+    for entry in oh:
+        parsed.append(
+            {
+                'display': entry.get('Display', []) or entry.get('display', []),
+                'components': entry.get('Components', []) or entry.get('components', []),
+                'open_now': entry.get('OpenNow', None),
+                'categories': [cat.get('Name') for cat in entry.get('Categories', [])]
+                if 'Categories' in entry
+                else [],
+            }
+        )
+    return parsed
+
+
 @mcp.tool()
 async def search_places(
     ctx: Context,
@@ -186,58 +222,25 @@ async def search_places(
         def safe_list(val):
             return val if isinstance(val, list) else ([] if val is None else [val])
 
-        def parse_contacts(contacts):
-            return {
-                'phones': [p['Value'] for p in contacts.get('Phones', [])] if contacts else [],
-                'websites': [w['Value'] for w in contacts.get('Websites', [])] if contacts else [],
-                'emails': [e['Value'] for e in contacts.get('Emails', [])] if contacts else [],
-                'faxes': [f['Value'] for f in contacts.get('Faxes', [])] if contacts else [],
-            }
-
-        def parse_opening_hours(result):
-            oh = result.get('OpeningHours')
-            if not oh:
-                contacts = result.get('Contacts', {})
-                oh = contacts.get('OpeningHours') if contacts else None
-            if not oh:
-                return []
-            # Normalize to list of dicts with display and components
-            if isinstance(oh, dict):
-                oh = [oh]
-            parsed = []
-            for entry in oh:
-                parsed.append(
-                    {
-                        'display': entry.get('Display', []) or entry.get('display', []),
-                        'components': entry.get('Components', []) or entry.get('components', []),
-                        'open_now': entry.get('OpenNow', None),
-                        'categories': [cat.get('Name') for cat in entry.get('Categories', [])]
-                        if 'Categories' in entry
-                        else [],
-                    }
-                )
-            return parsed
-
         result_places = []
         for result in places:
             if mode == 'raw':
                 place_data = result
             else:
-                contacts = parse_contacts(result.get('Contacts', {}))
-                opening_hours = parse_opening_hours(result)
+                position = result.get('Position', [None, None])
                 place_data = {
                     'place_id': result.get('PlaceId', 'Not available'),
                     'name': result.get('Title', 'Not available'),
                     'address': result.get('Address', {}).get('Label', 'Not available'),
                     'coordinates': {
-                        'longitude': result.get('Position', [None, None])[0],
-                        'latitude': result.get('Position', [None, None])[1],
+                        'longitude': position[0],
+                        'latitude': position[1],
                     },
                     'categories': [cat.get('Name') for cat in result.get('Categories', [])]
                     if result.get('Categories')
                     else [],
-                    'contacts': contacts,
-                    'opening_hours': opening_hours,
+                    'contacts': _parse_contacts(result.get('Contacts', {})),
+                    'opening_hours': _parse_opening_hours(result),
                 }
             result_places.append(place_data)
         result = {'query': query, 'places': result_places}
@@ -274,57 +277,19 @@ async def get_place(
         )
         if mode == 'raw':
             return response
-        contacts = {
-            'phones': [p['Value'] for p in response.get('Contacts', {}).get('Phones', [])]
-            if response.get('Contacts')
-            else [],
-            'websites': [w['Value'] for w in response.get('Contacts', {}).get('Websites', [])]
-            if response.get('Contacts')
-            else [],
-            'emails': [e['Value'] for e in response.get('Contacts', {}).get('Emails', [])]
-            if response.get('Contacts')
-            else [],
-            'faxes': [f['Value'] for f in response.get('Contacts', {}).get('Faxes', [])]
-            if response.get('Contacts')
-            else [],
-        }
-
-        def parse_opening_hours(result):
-            oh = result.get('OpeningHours')
-            if not oh:
-                contacts = result.get('Contacts', {})
-                oh = contacts.get('OpeningHours') if contacts else None
-            if not oh:
-                return []
-            if isinstance(oh, dict):
-                oh = [oh]
-            parsed = []
-            for entry in oh:
-                parsed.append(
-                    {
-                        'display': entry.get('Display', []) or entry.get('display', []),
-                        'components': entry.get('Components', []) or entry.get('components', []),
-                        'open_now': entry.get('OpenNow', None),
-                        'categories': [cat.get('Name') for cat in entry.get('Categories', [])]
-                        if 'Categories' in entry
-                        else [],
-                    }
-                )
-            return parsed
-
-        opening_hours = parse_opening_hours(response)
+        position = response.get('Position', [None, None])
         result = {
             'name': response.get('Title', 'Not available'),
             'address': response.get('Address', {}).get('Label', 'Not available'),
-            'contacts': contacts,
+            'contacts': _parse_contacts(response.get('Contacts', {})),
             'categories': [cat.get('Name', '') for cat in response.get('Categories', [])]
             if response.get('Categories')
             else [],
             'coordinates': {
-                'longitude': response.get('Position', [None, None])[0],
-                'latitude': response.get('Position', [None, None])[1],
+                'longitude': position[0],
+                'latitude': position[1],
             },
-            'opening_hours': opening_hours,
+            'opening_hours': _parse_opening_hours(response),
         }
         return result
     except Exception as e:
@@ -354,11 +319,12 @@ async def reverse_geocode(
         place = response.get('Place', {})
         if not place:
             return {'raw_response': response}
+        point = place.get('Geometry', {}).get('Point', [0, 0])
         result = {
             'name': place.get('Label') or place.get('Title', 'Unknown'),
             'coordinates': {
-                'longitude': place.get('Geometry', {}).get('Point', [0, 0])[0],
-                'latitude': place.get('Geometry', {}).get('Point', [0, 0])[1],
+                'longitude': point[0],
+                'latitude': point[1],
             },
             'categories': [cat.get('Name') for cat in place.get('Categories', [])],
             'address': place.get('Address', {}).get('Label', ''),
@@ -419,65 +385,21 @@ async def search_nearby(
                 if mode == 'raw':
                     results.append(item)
                 else:
-                    contacts = {
-                        'phones': [p['Value'] for p in item.get('Contacts', {}).get('Phones', [])]
-                        if item.get('Contacts')
-                        else [],
-                        'websites': [
-                            w['Value'] for w in item.get('Contacts', {}).get('Websites', [])
-                        ]
-                        if item.get('Contacts')
-                        else [],
-                        'emails': [e['Value'] for e in item.get('Contacts', {}).get('Emails', [])]
-                        if item.get('Contacts')
-                        else [],
-                        'faxes': [f['Value'] for f in item.get('Contacts', {}).get('Faxes', [])]
-                        if item.get('Contacts')
-                        else [],
-                    }
-
-                    def parse_opening_hours(result):
-                        oh = result.get('OpeningHours')
-                        if not oh:
-                            contacts = result.get('Contacts', {})
-                            oh = contacts.get('OpeningHours') if contacts else None
-                        if not oh:
-                            return []
-                        if isinstance(oh, dict):
-                            oh = [oh]
-                        parsed = []
-                        for entry in oh:
-                            parsed.append(
-                                {
-                                    'display': entry.get('Display', [])
-                                    or entry.get('display', []),
-                                    'components': entry.get('Components', [])
-                                    or entry.get('components', []),
-                                    'open_now': entry.get('OpenNow', None),
-                                    'categories': [
-                                        cat.get('Name') for cat in entry.get('Categories', [])
-                                    ]
-                                    if 'Categories' in entry
-                                    else [],
-                                }
-                            )
-                        return parsed
-
-                    opening_hours = parse_opening_hours(item)
+                    position = item.get('Position', [None, None])
                     results.append(
                         {
                             'place_id': item.get('PlaceId', 'Not available'),
                             'name': item.get('Title', 'Not available'),
                             'address': item.get('Address', {}).get('Label', 'Not available'),
                             'coordinates': {
-                                'longitude': item.get('Position', [None, None])[0],
-                                'latitude': item.get('Position', [None, None])[1],
+                                'longitude': position[0],
+                                'latitude': position[1],
                             },
                             'categories': [cat.get('Name') for cat in item.get('Categories', [])]
                             if item.get('Categories')
                             else [],
-                            'contacts': contacts,
-                            'opening_hours': opening_hours,
+                            'contacts': _parse_contacts(item.get('Contacts', {})),
+                            'opening_hours': _parse_opening_hours(item),
                         }
                     )
             if results:
@@ -585,17 +507,19 @@ async def search_places_open_now(
                     elif isinstance(ch, dict):
                         if ch.get('OpenNow', False):
                             open_now = True
+                position = result.get('Position', [0, 0])
+                address = result.get('Address', {})
                 place_data = {
                     'place_id': result.get('PlaceId', ''),
                     'name': result.get('Title', 'Unknown'),
                     'coordinates': {
-                        'longitude': result.get('Position', [0, 0])[0],
-                        'latitude': result.get('Position', [0, 0])[1],
+                        'longitude': position[0],
+                        'latitude': position[1],
                     },
-                    'address': result.get('Address', {}).get('Label', ''),
-                    'country': result.get('Address', {}).get('Country', {}).get('Name', ''),
-                    'region': result.get('Address', {}).get('Region', {}).get('Name', ''),
-                    'municipality': result.get('Address', {}).get('Locality', ''),
+                    'address': address.get('Label', ''),
+                    'country': address.get('Country', {}).get('Name', ''),
+                    'region': address.get('Region', {}).get('Name', ''),
+                    'municipality': address.get('Locality', ''),
                     'categories': [cat.get('Name') for cat in result.get('Categories', [])],
                     'contacts': result.get('Contacts', {}),
                     'opening_hours': opening_hours_info,
@@ -660,7 +584,7 @@ async def calculate_route(
     """
     include_leg_geometry = False
     mode = 'summary'
-    client = GeoRoutesClient().geo_routes_client
+    client = geo_routes_client.geo_routes_client
 
     # Check if client is None before proceeding
     if client is None:
@@ -730,7 +654,7 @@ async def optimize_waypoints(
 
     Returns summary (optimized order, total distance, duration, etc.) or full response if mode='raw'.
     """
-    client = GeoRoutesClient().geo_routes_client
+    client = geo_routes_client.geo_routes_client
 
     # Check if client is None before proceeding
     if client is None:
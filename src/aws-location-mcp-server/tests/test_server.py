@@ -620,9 +620,9 @@ async def test_calculate_route(mock_boto3_client, mock_context):
     }
 
     # Create a mock for the calculate_route function
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
         # Set up the mock to return our mock_boto3_client
-        mock_geo_client.return_value.geo_routes_client = mock_boto3_client
+        mock_geo_client.geo_routes_client = mock_boto3_client
 
         # Mock the asyncio.to_thread function to return the mock response directly
         with patch('asyncio.to_thread', return_value=mock_response):
@@ -651,8 +651,8 @@ async def test_calculate_route_error(mock_boto3_client, mock_context):
     mock_boto3_client.calculate_routes.side_effect = Exception('Test error')
 
     # Patch the geo_routes_client in the server module
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
-        mock_geo_client.return_value.geo_routes_client = mock_boto3_client
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
+        mock_geo_client.geo_routes_client = mock_boto3_client
 
         # Mock asyncio.to_thread to propagate the exception
         with patch('asyncio.to_thread', side_effect=Exception('Test error')):
@@ -672,8 +672,8 @@ async def test_calculate_route_error(mock_boto3_client, mock_context):
 @pytest.mark.asyncio
 async def test_calculate_route_no_client(mock_context):
     """Test calculate_route when client is not initialized."""
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
-        mock_geo_client.return_value.geo_routes_client = None
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
+        mock_geo_client.geo_routes_client = None
         result = await calculate_route(
             mock_context,
             departure_position=[-122.335167, 47.608013],
@@ -689,8 +689,8 @@ async def test_calculate_route_no_routes(mock_boto3_client, mock_context):
     # Set up mock response with no routes
     mock_response = {'Routes': []}
 
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
-        mock_geo_client.return_value.geo_routes_client = mock_boto3_client
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
+        mock_geo_client.geo_routes_client = mock_boto3_client
         with patch('asyncio.to_thread', return_value=mock_response):
             result = await calculate_route(
                 mock_context,
@@ -716,9 +716,9 @@ async def test_calculate_route_raw_mode(mock_boto3_client, mock_context):
     mock_response = {'Routes': [{'Distance': 100.0, 'DurationSeconds': 300}]}
 
     # Create a mock for the calculate_route function
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
         # Set up the mock to return our mock_boto3_client
-        mock_geo_client.return_value.geo_routes_client = mock_boto3_client
+        mock_geo_client.geo_routes_client = mock_boto3_client
 
         # Mock asyncio.to_thread to return the mock response
         with patch('asyncio.to_thread', return_value=mock_response):
@@ -752,8 +752,8 @@ async def test_optimize_waypoints(mock_boto3_client, mock_context):
     }
 
     # Patch the geo_routes_client in the server module
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
-        mock_geo_client.return_value.geo_routes_client = mock_boto3_client
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
+        mock_geo_client.geo_routes_client = mock_boto3_client
 
         # Mock asyncio.to_thread to return the mock response directly
         with patch(
@@ -782,8 +782,8 @@ async def test_optimize_waypoints_error(mock_boto3_client, mock_context):
     mock_boto3_client.optimize_waypoints.side_effect = Exception('Test error')
 
     # Patch the geo_routes_client in the server module
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
-        mock_geo_client.return_value.geo_routes_client = mock_boto3_client
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
+        mock_geo_client.geo_routes_client = mock_boto3_client
 
         # Mock asyncio.to_thread to propagate the exception
         with patch('asyncio.to_thread', side_effect=Exception('Test error')):
@@ -804,8 +804,8 @@ async def test_optimize_waypoints_error(mock_boto3_client, mock_context):
 @pytest.mark.asyncio
 async def test_optimize_waypoints_no_client(mock_context):
     """Test optimize_waypoints when client is not initialized."""
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
-        mock_geo_client.return_value.geo_routes_client = None
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
+        mock_geo_client.geo_routes_client = None
         result = await optimize_waypoints(
             mock_context,
             origin_position=[-122.335167, 47.608013],
@@ -822,8 +822,8 @@ async def test_optimize_waypoints_no_routes(mock_boto3_client, mock_context):
     # Set up mock response with no routes
     mock_boto3_client.optimize_waypoints.return_value = {'Routes': []}
 
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
-        mock_geo_client.return_value.geo_routes_client = mock_boto3_client
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
+        mock_geo_client.geo_routes_client = mock_boto3_client
         with patch(
             'asyncio.to_thread', return_value=mock_boto3_client.optimize_waypoints.return_value
         ):
@@ -844,8 +844,8 @@ async def test_optimize_waypoints_raw_mode(mock_boto3_client, mock_context):
     mock_response = {'Routes': [{'Distance': 150.0, 'DurationSeconds': 450}]}
     mock_boto3_client.optimize_waypoints.return_value = mock_response
 
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
-        mock_geo_client.return_value.geo_routes_client = mock_boto3_client
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
+        mock_geo_client.geo_routes_client = mock_boto3_client
         with patch('asyncio.to_thread', return_value=mock_response):
             result = await optimize_waypoints(
                 mock_context,
@@ -912,10 +912,10 @@ async def test_calculate_route_with_leg_geometry(mock_boto3_client, mock_context
         return mock_response
 
     # Create a mock for the calculate_route function
-    with patch('awslabs.aws_location_server.server.GeoRoutesClient') as mock_geo_client:
+    with patch('awslabs.aws_location_server.server.geo_routes_client') as mock_geo_client:
         # Set up the mock to return our mock_boto3_client with the custom implementation
         mock_boto3_client.calculate_routes.side_effect = mock_calculate_routes
-        mock_geo_client.return_value.geo_routes_client = mock_boto3_client
+        mock_geo_client.geo_routes_client = mock_boto3_client
 
         # Mock asyncio.to_thread to return the mock response
         with patch('asyncio.to_thread', side_effect=lambda f, **kwargs: f(**kwargs)):
@@ -8,6 +8,7 @@
 # or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
 # and limitations under the License.
+import time
 from ..models import KnowledgeBaseMapping
 from loguru import logger
 from typing import TYPE_CHECKING
@@ -21,6 +22,11 @@ else:
 
 DEFAULT_KNOWLEDGE_BASE_TAG_INCLUSION_KEY = 'mcp-multirag-kb'
 
+# Discovery makes several Bedrock API calls per knowledge base, so results are reused for a short
+# time when clients re-read the knowledge base resource in quick succession
+DISCOVERY_CACHE_TTL_SECONDS = 10
+_discovery_cache: dict[tuple[object, str], tuple[float, KnowledgeBaseMapping]] = {}
+
 
 async def discover_knowledge_bases(
     agent_client: AgentsforBedrockClient,
@@ -35,6 +41,12 @@ async def discover_knowledge_bases(
     Returns:
         KnowledgeBaseMapping: A mapping of knowledge base IDs to knowledge base details
     """
+    cache_key = (agent_client, tag_key)
+    cached = _discovery_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < DISCOVERY_CACHE_TTL_SECONDS:
+        logger.debug(f'Using cached knowledge bases for tag {tag_key}')
+        return cached[1]
+
     result: KnowledgeBaseMapping = {}
 
     # Collect all knowledge bases with their ARNs in one pass
@@ -76,4 +88,5 @@ async def discover_knowledge_bases(
 
         result[kb_id]['data_sources'] = data_sources
 
+    _discovery_cache[cache_key] = (time.monotonic(), result)
     return result
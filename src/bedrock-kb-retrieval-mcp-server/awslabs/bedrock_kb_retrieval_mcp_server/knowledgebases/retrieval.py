@@ -92,18 +92,22 @@ async def query_knowledge_base(
         retrievalConfiguration=retrieve_request,
     )
     results = response['retrievalResults']
-    documents: list[dict] = []
+    # Serialize each document as it is collected rather than building a list of dicts
+    # and encoding it in a second pass
+    documents: list[str] = []
     for result in results:
         if result['content'].get('type') == 'IMAGE':
             logger.warning('Images are not supported at this time. Skipping...')
             continue
         else:
             documents.append(
-                {
-                    'content': result['content'],
-                    'location': result.get('location', ''),
-                    'score': result.get('score', ''),
-                }
+                json.dumps(
+                    {
+                        'content': result['content'],
+                        'location': result.get('location', ''),
+                        'score': result.get('score', ''),
+                    }
+                )
             )
 
-    return '\n\n'.join([json.dumps(document) for document in documents])
+    return '\n\n'.join(documents)
@@ -13,9 +13,10 @@
 
 import pytest
 from awslabs.bedrock_kb_retrieval_mcp_server.knowledgebases.discovery import (
+    DISCOVERY_CACHE_TTL_SECONDS,
     discover_knowledge_bases,
 )
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 
 class TestDiscoverKnowledgeBases:
@@ -190,3 +191,28 @@ class TestDiscoverKnowledgeBases:
             resourceArn='arn:aws:bedrock:us-west-2:123456789012:knowledge-base/kb-12345'
         )
         mock_bedrock_agent_client.get_paginator.assert_any_call('list_data_sources')
+
+    @pytest.mark.asyncio
+    async def test_discover_knowledge_bases_uses_cache(self, mock_bedrock_agent_client):
+        """Test that repeated discovery within the cache TTL reuses the previous result."""
+        first = await discover_knowledge_bases(mock_bedrock_agent_client)
+        calls = mock_bedrock_agent_client.get_knowledge_base.call_count
+
+        second = await discover_knowledge_bases(mock_bedrock_agent_client)
+
+        assert second == first
+        assert mock_bedrock_agent_client.get_knowledge_base.call_count == calls
+
+    @pytest.mark.asyncio
+    async def test_discover_knowledge_bases_cache_expires(self, mock_bedrock_agent_client):
+        """Test that discovery calls Bedrock again once the cached result has expired."""
+        with patch(
+            'awslabs.bedrock_kb_retrieval_mcp_server.knowledgebases.discovery.time.monotonic',
+            side_effect=[0, DISCOVERY_CACHE_TTL_SECONDS, DISCOVERY_CACHE_TTL_SECONDS],
+        ):
+            await discover_knowledge_bases(mock_bedrock_agent_client)
+            calls = mock_bedrock_agent_client.get_knowledge_base.call_count
+
+            await discover_knowledge_bases(mock_bedrock_agent_client)
+
+        assert mock_bedrock_agent_client.get_knowledge_base.call_count == 2 * calls
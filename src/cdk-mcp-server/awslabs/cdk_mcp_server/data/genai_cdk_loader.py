@@ -61,21 +61,23 @@ async def fetch_readme(
         cache_key in _readme_cache
         and datetime.now() - _readme_cache[cache_key]['timestamp'] < CACHE_TTL
     ):
-        logger.debug(f'Using cached README for {path}')
+        logger.debug('Using cached README for %s', path)
         return _readme_cache[cache_key]['data']
 
     # Fetch from GitHub
     readme_url = (
         f'{GITHUB_RAW_CONTENT_URL}/{REPO_OWNER}/{REPO_NAME}/main/{BASE_PATH}/{path}/README.md'
     )
-    logger.info(f'Fetching README from {readme_url}')
+    logger.info('Fetching README from %s', readme_url)
 
     try:
         async with httpx.AsyncClient() as client:
             response = await client.get(readme_url)
 
             if response.status_code != 200:
-                logger.warning(f'Failed to fetch README for {path}: HTTP {response.status_code}')
+                logger.warning(
+                    'Failed to fetch README for %s: HTTP %s', path, response.status_code
+                )
                 return {
                     'error': f'Failed to fetch README for {path}: HTTP {response.status_code}',
                     'status_code': response.status_code,
@@ -98,7 +100,7 @@ async def fetch_readme(
 
             return result
     except Exception as e:
-        logger.error(f'Error fetching README for {path}: {str(e)}')
+        logger.error('Error fetching README for %s: %s', path, e)
         return {
             'error': f'Error fetching README: {str(e)}',
             'status': 'error',
@@ -206,8 +208,9 @@ async def get_section(
     import urllib.parse
 
     decoded_section_name = urllib.parse.unquote(section_name)
-    logger.info(f"Looking for section '{decoded_section_name}' in {path}")
-    logger.info(f'Available sections: {", ".join(sections.keys())}')
+    logger.info("Looking for section '%s' in %s", decoded_section_name, path)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Available sections: %s', ', '.join(sections.keys()))
 
     # First try direct match after decoding
     for heading, content in sections.items():
@@ -220,7 +223,7 @@ async def get_section(
             }
 
     # Section not found
-    logger.warning(f"Section '{section_name}' not found in {path}")
+    logger.warning("Section '%s' not found in %s", section_name, path)
     return {
         'error': f"Section '{section_name}' not found in {path}",
         'status': 'not_found',
@@ -307,7 +310,7 @@ async def fetch_bedrock_subdirectories() -> List[Dict[str, Any]]:
 
             if response.status_code != 200:
                 logger.warning(
-                    f'Failed to fetch bedrock subdirectories: HTTP {response.status_code}'
+                    'Failed to fetch bedrock subdirectories: HTTP %s', response.status_code
                 )
                 return []
 
@@ -371,7 +374,7 @@ async def fetch_bedrock_subdirectories() -> List[Dict[str, Any]]:
 
             return subdirs
     except Exception as e:
-        logger.error(f'Error fetching bedrock subdirectories: {str(e)}')
+        logger.error('Error fetching bedrock subdirectories: %s', e)
         return []
 
 
@@ -397,7 +400,7 @@ async def fetch_repo_structure() -> Dict[str, Any]:
             )
 
             if response.status_code != 200:
-                logger.warning(f'Failed to fetch repo structure: HTTP {response.status_code}')
+                logger.warning('Failed to fetch repo structure: HTTP %s', response.status_code)
                 return {'error': 'Failed to fetch repository structure'}
 
             contents = response.json()
@@ -470,7 +473,7 @@ async def fetch_repo_structure() -> Dict[str, Any]:
 
             return _constructs_cache
     except Exception as e:
-        logger.error(f'Error fetching repo structure: {str(e)}')
+        logger.error('Error fetching repo structure: %s', e)
         return {'error': f'Error fetching repository structure: {str(e)}'}
 
 
@@ -487,7 +490,7 @@ async def list_available_constructs(construct_type: Optional[str] = None) -> Lis
     repo_structure = await fetch_repo_structure()
 
     if 'error' in repo_structure:
-        logger.error(f'Error in list_available_constructs: {repo_structure["error"]}')
+        logger.error('Error in list_available_constructs: %s', repo_structure['error'])
         return []
 
     construct_types = repo_structure.get('construct_types', {})
@@ -499,7 +502,9 @@ async def list_available_constructs(construct_type: Optional[str] = None) -> Lis
     if construct_type:
         if construct_type not in available_types:
             logger.warning(
-                f"Construct type '{construct_type}' not found. Available types: {', '.join(available_types)}"
+                "Construct type '%s' not found. Available types: %s",
+                construct_type,
+                ', '.join(available_types),
             )
             return []
         filter_types = [construct_type]
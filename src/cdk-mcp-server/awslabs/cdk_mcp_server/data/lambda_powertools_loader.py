@@ -15,18 +15,24 @@ import os
 from typing import Dict
 
 
+TOPIC_MAP = {
+    'index': 'Overview and table of contents',
+    'logging': 'Structured logging implementation',
+    'tracing': 'Tracing implementation',
+    'metrics': 'Metrics implementation',
+    'cdk': 'CDK integration patterns',
+    'dependencies': 'Dependencies management',
+    'insights': 'Lambda Insights integration',
+    'bedrock': 'Bedrock Agent integration',
+}
+
+# The guidance files ship with the package and never change at runtime
+_section_cache: Dict[str, str] = {}  # Cache for guidance content, keyed by topic
+
+
 def get_topic_map() -> Dict[str, str]:
     """Get a dictionary mapping topic names to their descriptions."""
-    return {
-        'index': 'Overview and table of contents',
-        'logging': 'Structured logging implementation',
-        'tracing': 'Tracing implementation',
-        'metrics': 'Metrics implementation',
-        'cdk': 'CDK integration patterns',
-        'dependencies': 'Dependencies management',
-        'insights': 'Lambda Insights integration',
-        'bedrock': 'Bedrock Agent integration',
-    }
+    return TOPIC_MAP
 
 
 def get_lambda_powertools_section(topic: str = '') -> str:
@@ -44,6 +50,9 @@ def get_lambda_powertools_section(topic: str = '') -> str:
     if not topic or topic.lower() == 'index':
         topic = 'index'
 
+    if topic.lower() in _section_cache:
+        return _section_cache[topic.lower()]
+
     if topic.lower() in topic_map:
         # Fix the path to correctly point to the static directory (parent of 'data')
         base_dir = os.path.dirname(
@@ -52,7 +61,9 @@ def get_lambda_powertools_section(topic: str = '') -> str:
         file_path = os.path.join(base_dir, 'static', 'lambda_powertools', f'{topic.lower()}.md')
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+                content = f.read()
+            _section_cache[topic.lower()] = content
+            return content
         except FileNotFoundError:
             return f"Error: File for topic '{topic}' not found. (Looking in: {file_path})"
     else:
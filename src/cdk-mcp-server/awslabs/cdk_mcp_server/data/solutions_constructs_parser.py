@@ -98,7 +98,7 @@ async def get_pattern_info(pattern_name: str) -> Dict[str, Any]:
     global _pattern_details_cache
 
     try:
-        logger.info(f'Fetching pattern info for {pattern_name}')
+        logger.info('Fetching pattern info for %s', pattern_name)
 
         # Decode the pattern name if it's URL-encoded
         pattern_name = urllib.parse.unquote(pattern_name)
@@ -109,18 +109,18 @@ async def get_pattern_info(pattern_name: str) -> Dict[str, Any]:
             and pattern_name in _pattern_details_cache
             and datetime.now() - _pattern_details_cache[pattern_name]['timestamp'] < CACHE_TTL
         ):
-            logger.info(f'Using cached info for {pattern_name}')
+            logger.info('Using cached info for %s', pattern_name)
             return _pattern_details_cache[pattern_name]['data']
 
         # Fetch README.md content
         async with httpx.AsyncClient() as client:
             readme_url = f'{GITHUB_RAW_CONTENT_URL}/{REPO_OWNER}/{REPO_NAME}/main/{PATTERNS_PATH}/{pattern_name}/README.md'
-            logger.info(f'Fetching README from {readme_url}')
+            logger.info('Fetching README from %s', readme_url)
             response = await client.get(readme_url)
 
             if response.status_code != 200:
                 logger.warning(
-                    f'Failed to fetch README for {pattern_name}: HTTP {response.status_code}'
+                    'Failed to fetch README for %s: HTTP %s', pattern_name, response.status_code
                 )
                 return {
                     'error': f'Pattern {pattern_name} not found or README.md not available',
@@ -151,7 +151,7 @@ async def get_pattern_info(pattern_name: str) -> Dict[str, Any]:
 
         return pattern_info
     except Exception as e:
-        logger.error(f'Error processing pattern {pattern_name}: {str(e)}')
+        logger.error('Error processing pattern %s: %s', pattern_name, e)
         return {
             'error': f'Error processing pattern {pattern_name}: {str(e)}',
             'pattern_name': pattern_name,
@@ -168,7 +168,7 @@ async def get_pattern_raw(pattern_name: str) -> Dict[str, Any]:
         Dictionary with raw pattern documentation
     """
     try:
-        logger.info(f'Fetching raw pattern info for {pattern_name}')
+        logger.info('Fetching raw pattern info for %s', pattern_name)
 
         # Decode the pattern name if it's URL-encoded
         pattern_name = urllib.parse.unquote(pattern_name)
@@ -176,12 +176,12 @@ async def get_pattern_raw(pattern_name: str) -> Dict[str, Any]:
         # Fetch README.md content
         async with httpx.AsyncClient() as client:
             readme_url = f'{GITHUB_RAW_CONTENT_URL}/{REPO_OWNER}/{REPO_NAME}/main/{PATTERNS_PATH}/{pattern_name}/README.md'
-            logger.info(f'Fetching README from {readme_url}')
+            logger.info('Fetching README from %s', readme_url)
             response = await client.get(readme_url)
 
             if response.status_code != 200:
                 logger.warning(
-                    f'Failed to fetch README for {pattern_name}: HTTP {response.status_code}'
+                    'Failed to fetch README for %s: HTTP %s', pattern_name, response.status_code
                 )
                 return {
                     'error': f'Pattern {pattern_name} not found or README.md not available',
@@ -201,7 +201,7 @@ async def get_pattern_raw(pattern_name: str) -> Dict[str, Any]:
                 'message': f'Retrieved pattern documentation for {pattern_name}',
             }
     except Exception as e:
-        logger.error(f'Error fetching raw pattern {pattern_name}: {str(e)}')
+        logger.error('Error fetching raw pattern %s: %s', pattern_name, e)
         return {
             'status': 'error',
             'pattern_name': pattern_name,
@@ -720,7 +720,7 @@ async def search_patterns(services: List[str]) -> List[Dict[str, Any]]:
         List of matching patterns with their information
     """
     try:
-        logger.info(f'Searching for patterns with services: {services}')
+        logger.info('Searching for patterns with services: %s', services)
 
         # Get all patterns
         all_patterns = await fetch_pattern_list()
@@ -754,10 +754,10 @@ async def search_patterns(services: List[str]) -> List[Dict[str, Any]]:
 
             matching_patterns.append(pattern_info)
 
-        logger.info(f'Found {len(matching_patterns)} matching patterns')
+        logger.info('Found %s matching patterns', len(matching_patterns))
         return matching_patterns
     except Exception as e:
-        logger.error(f'Error searching patterns: {str(e)}')
+        logger.error('Error searching patterns: %s', e)
         return []
 
 
@@ -778,7 +778,7 @@ async def get_all_patterns_info() -> List[Dict[str, Any]]:
                 pattern_info = await get_pattern_info(pattern)
                 result.append(pattern_info)
             except Exception as e:
-                logger.error(f'Error fetching info for pattern {pattern}: {str(e)}')
+                logger.error('Error fetching info for pattern %s: %s', pattern, e)
                 # Add a minimal error entry so we don't lose the pattern in the list
                 result.append(
                     {
@@ -788,8 +788,8 @@ async def get_all_patterns_info() -> List[Dict[str, Any]]:
                     }
                 )
 
-        logger.info(f'Fetched information for {len(result)} patterns')
+        logger.info('Fetched information for %s patterns', len(result))
         return result
     except Exception as e:
-        logger.error(f'Error fetching all patterns info: {str(e)}')
+        logger.error('Error fetching all patterns info: %s', e)
         return []
@@ -60,10 +60,10 @@ async def test_fetch_readme():
         assert 'bedrock' in result['path']
 
         # Verify the HTTP call was made to the expected URL
-        mock_client.get.assert_called_once()
-        call_args = mock_client.get.call_args[0][0]
-        assert 'README.md' in call_args
-        assert 'bedrock' in call_args
+        mock_client.get.assert_called_once_with(
+            'https://raw.githubusercontent.com/awslabs/generative-ai-cdk-constructs'
+            '/main/src/cdk-lib/bedrock/README.md'
+        )
 
 
 @pytest.mark.asyncio
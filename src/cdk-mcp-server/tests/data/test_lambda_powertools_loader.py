@@ -41,6 +41,7 @@ def test_get_topic_map():
     assert topic_map['bedrock'] == 'Bedrock Agent integration'
 
 
+@patch('awslabs.cdk_mcp_server.data.lambda_powertools_loader._section_cache', {})
 @patch('os.path.dirname')
 @patch('os.path.join')
 @patch('builtins.open', new_callable=mock_open, read_data='Test content')
@@ -74,6 +75,7 @@ def test_get_lambda_powertools_section_success(mock_file, mock_join, mock_dirnam
     )
 
 
+@patch('awslabs.cdk_mcp_server.data.lambda_powertools_loader._section_cache', {})
 @patch('os.path.dirname')
 @patch('os.path.join')
 @patch('builtins.open')
@@ -106,3 +108,12 @@ def test_get_lambda_powertools_section_invalid_topic():
         if topic != 'index':  # index is not shown in the list
             assert topic in content
             assert topic_map[topic] in content
+
+
+@patch('awslabs.cdk_mcp_server.data.lambda_powertools_loader._section_cache', {})
+@patch('builtins.open', new_callable=mock_open, read_data='Test content')
+def test_get_lambda_powertools_section_cached(mock_file):
+    """Test that a section file is only read once."""
+    assert get_lambda_powertools_section('logging') == 'Test content'
+    assert get_lambda_powertools_section('logging') == 'Test content'
+    mock_file.assert_called_once()
@@ -51,6 +51,15 @@ logger.configure(
 )
 
 
+# Specialized fill-in messages for the standard documentation files, keyed by file name
+DOC_FILE_MESSAGES = {
+    'README.md': "Create a comprehensive README with installation instructions, usage examples, and a concise overview of the project's purpose and capabilities. When possible, enhance the Architecture Diagram section by using the AWS Diagram MCP Server (awslabs.aws-diagram-mcp-server) to create visual representations of the system architecture.",
+    'API.md': 'Document all API endpoints, request/response formats, and provide usage examples. Include authentication requirements if applicable.',
+    'BACKEND.md': 'Explain the backend architecture, database schema, and key components. The Data Flow section contains guidance for creating diagrams. When possible, enhance your documentation by using the AWS Diagram MCP Server (awslabs.aws-diagram-mcp-server) to create visual representations of data flow and component relationships.',
+    'FRONTEND.md': 'Document the frontend structure, components, and state management approach. Include screenshots of key UI elements if available.',
+}
+
+
 class _ProjectInfo(BaseModel):
     """Project information model.
 
@@ -456,17 +465,10 @@ async def generate_documentation(
         for file_path in generated_files:
             path = Path(file_path)
             doc_type = 'docs' if path.name != 'README.md' else 'readme'
-            message = f'Please fill the {path.name} with comprehensive content based on the project analysis. Include detailed explanations and code examples where appropriate.'
-
-            # Add specialized messages based on file type
-            if path.name == 'README.md':
-                message = "Create a comprehensive README with installation instructions, usage examples, and a concise overview of the project's purpose and capabilities. When possible, enhance the Architecture Diagram section by using the AWS Diagram MCP Server (awslabs.aws-diagram-mcp-server) to create visual representations of the system architecture."
-            elif path.name == 'API.md':
-                message = 'Document all API endpoints, request/response formats, and provide usage examples. Include authentication requirements if applicable.'
-            elif path.name == 'BACKEND.md':
-                message = 'Explain the backend architecture, database schema, and key components. The Data Flow section contains guidance for creating diagrams. When possible, enhance your documentation by using the AWS Diagram MCP Server (awslabs.aws-diagram-mcp-server) to create visual representations of data flow and component relationships.'
-            elif path.name == 'FRONTEND.md':
-                message = 'Document the frontend structure, components, and state management approach. Include screenshots of key UI elements if available.'
+            # Use the specialized message for known file types, else a generic one
+            message = DOC_FILE_MESSAGES.get(path.name)
+            if message is None:
+                message = f'Please fill the {path.name} with comprehensive content based on the project analysis. Include detailed explanations and code examples where appropriate.'
 
             # Add suggestions for companion MCP servers
             if 'architecture' in str(path).lower():
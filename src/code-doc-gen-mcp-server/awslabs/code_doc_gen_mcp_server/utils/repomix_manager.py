@@ -11,6 +11,7 @@
 
 """Manager for repomix operations with streamlined directory structure extraction."""
 
+import asyncio
 import time
 from loguru import logger
 from mcp.server.fastmcp import Context
@@ -263,9 +264,10 @@ class RepomixManager:
                 if ctx:
                     await ctx.info('Using repomix to generate directory structure...')
 
-                # Process repository
+                # Process repository. Walking a large repository takes a while, so run it in a
+                # worker thread instead of blocking the event loop (and every other tool call)
                 processor = RepoProcessor(str(project_path), config=config)
-                result_obj = processor.process()
+                result_obj = await asyncio.to_thread(processor.process)
 
                 # Try to get directory structure directly from result object
                 directory_structure = None
@@ -12,9 +12,8 @@
 """Test fixtures for the cost-analysis-mcp-server."""
 
 import pytest
-import tempfile
 from pathlib import Path
-from typing import Any, Dict, Generator
+from typing import Any, Dict
 from unittest.mock import AsyncMock, MagicMock
 
 
@@ -156,10 +155,9 @@ export class MyStack extends cdk.Stack {
 
 
 @pytest.fixture
-def temp_output_dir() -> Generator[str, None, None]:
+def temp_output_dir(tmp_path: Path) -> str:
     """Create a temporary directory for test outputs."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+    return str(tmp_path)
 
 
 @pytest.fixture
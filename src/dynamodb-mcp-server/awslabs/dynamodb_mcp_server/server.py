@@ -95,6 +95,7 @@ billing_mode: Literal['PROVISIONED', 'PAY_PER_REQUEST'] = Field(
     description='Specifies if billing is PAY_PER_REQUEST or by provisioned throughput',
 )
 resource_arn: str = Field(description='The Amazon Resource Name (ARN) of the DynamoDB resource')
+region_name: str = Field(default=None, description='The aws region to run the tool')
 
 
 @app.tool()
@@ -104,7 +105,7 @@ async def put_resource_policy(
     policy: Union[str, Dict[str, Any]] = Field(
         description='An AWS resource-based policy document in JSON format or dictionary.'
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Attaches a resource-based policy document (max 20 KB) to a DynamoDB table or stream. You can control permissions for both tables and their indexes through the policy."""
     client = get_dynamodb_client(region_name)
@@ -121,7 +122,7 @@ async def put_resource_policy(
 @handle_exceptions
 async def get_resource_policy(
     resource_arn: str = resource_arn,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns the resource-based policy document attached to a DynamoDB table or stream in JSON format."""
     client = get_dynamodb_client(region_name)
@@ -143,7 +144,7 @@ async def scan(
     select: Select = select,
     limit: int = limit,
     exclusive_start_key: Dict[str, KeyAttributeValue] = exclusive_start_key,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns items and attributes by scanning a table or secondary index. Reads up to Limit items or 1 MB of data, with optional FilterExpression to reduce results."""
     client = get_dynamodb_client(region_name)
@@ -195,7 +196,7 @@ async def query(
         default=None, description='Ascending (true) or descending (false).'
     ),
     exclusive_start_key: Dict[str, KeyAttributeValue] = exclusive_start_key,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns items from a table or index matching a partition key value, with optional sort key filtering."""
     client = get_dynamodb_client(region_name)
@@ -254,7 +255,7 @@ async def update_item(
     ),
     expression_attribute_names: Dict[str, str] = expression_attribute_names,
     expression_attribute_values: Dict[str, AttributeValue] = expression_attribute_values,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Edits an existing item's attributes, or adds a new item to the table if it does not already exist."""
     client = get_dynamodb_client(region_name)
@@ -285,7 +286,7 @@ async def get_item(
     key: Dict[str, KeyAttributeValue] = key,
     expression_attribute_names: Dict[str, str] = expression_attribute_names,
     projection_expression: str = projection_expression,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns attributes for an item with the given primary key. Uses eventually consistent reads by default, or set ConsistentRead=true for strongly consistent reads."""
     client = get_dynamodb_client(region_name)
@@ -314,7 +315,7 @@ async def put_item(
     ),
     expression_attribute_names: Dict[str, str] = expression_attribute_names,
     expression_attribute_values: Dict[str, Any] = expression_attribute_values,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Creates a new item or replaces an existing item in a table. Use condition expressions to control whether to create new items or update existing ones."""
     client = get_dynamodb_client(region_name)
@@ -346,7 +347,7 @@ async def delete_item(
     ),
     expression_attribute_names: Dict[str, str] = expression_attribute_names,
     expression_attribute_values: Dict[str, AttributeValue] = expression_attribute_values,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Deletes a single item in a table by primary key. You can perform a conditional delete operation that deletes the item if it exists, or if it has an expected attribute value."""
     client = get_dynamodb_client(region_name)
@@ -375,7 +376,7 @@ async def update_time_to_live(
     time_to_live_specification: TimeToLiveSpecification = Field(
         description='The new TTL settings'
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Enables or disables Time to Live (TTL) for the specified table. Note: The epoch time format is the number of seconds elapsed since 12:00:00 AM January 1, 1970 UTC."""
     client = get_dynamodb_client(region_name)
@@ -421,7 +422,7 @@ async def update_table(
     warm_throughput: WarmThroughput = Field(
         default=None, description='The new warm throughput settings.'
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Modifies table settings including provisioned throughput, global secondary indexes, and DynamoDB Streams configuration. This is an asynchronous operation."""
     client = get_dynamodb_client(region_name)
@@ -465,7 +466,7 @@ async def list_tables(
         default=None,
         description='Max number of table names to return',
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns a paginated list of table names in your account."""
     client = get_dynamodb_client(region_name)
@@ -501,7 +502,7 @@ async def create_table(
         default=None,
         description='Provisioned throughput settings. Required if BillingMode is PROVISIONED.',
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Creates a new DynamoDB table with optional secondary indexes. This is an asynchronous operation."""
     client = get_dynamodb_client(region_name)
@@ -526,7 +527,7 @@ async def create_table(
 @handle_exceptions
 async def describe_table(
     table_name: str = table_name,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns table information including status, creation time, key schema and indexes."""
     client = get_dynamodb_client(region_name)
@@ -541,7 +542,7 @@ async def create_backup(
     backup_name: str = Field(
         description='Specified name for the backup.',
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Creates a backup of a DynamoDB table."""
     client = get_dynamodb_client(region_name)
@@ -555,7 +556,7 @@ async def describe_backup(
     backup_arn: str = Field(
         description='The Amazon Resource Name (ARN) associated with the backup.',
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Describes an existing backup of a table."""
     client = get_dynamodb_client(region_name)
@@ -579,7 +580,7 @@ async def list_backups(
     limit: int = Field(
         default=None, description='Maximum number of backups to return.', ge=1, le=100
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns a list of table backups."""
     client = get_dynamodb_client(region_name)
@@ -609,7 +610,7 @@ async def restore_table_from_backup(
     target_table_name: str = Field(
         description='The name of the new table.',
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Creates a new table from a backup."""
     client = get_dynamodb_client(region_name)
@@ -622,7 +623,7 @@ async def restore_table_from_backup(
 @app.tool()
 @handle_exceptions
 async def describe_limits(
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns the current provisioned-capacity quotas for your AWS account and tables in a Region."""
     client = get_dynamodb_client(region_name)
@@ -639,7 +640,7 @@ async def describe_limits(
 @handle_exceptions
 async def describe_time_to_live(
     table_name: str = table_name,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns the Time to Live (TTL) settings for a table."""
     client = get_dynamodb_client(region_name)
@@ -650,7 +651,7 @@ async def describe_time_to_live(
 @app.tool()
 @handle_exceptions
 async def describe_endpoints(
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns DynamoDB endpoints for the current region."""
     client = get_dynamodb_client(region_name)
@@ -664,7 +665,7 @@ async def describe_export(
     export_arn: str = Field(
         description='The Amazon Resource Name (ARN) associated with the export.',
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns information about a table export."""
     client = get_dynamodb_client(region_name)
@@ -684,7 +685,7 @@ async def list_exports(
         default=None,
         description='The Amazon Resource Name (ARN) associated with the exported table.',
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns a list of table exports."""
     client = get_dynamodb_client(region_name)
@@ -707,7 +708,7 @@ async def list_exports(
 @handle_exceptions
 async def describe_continuous_backups(
     table_name: str = table_name,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns continuous backup and point in time recovery status for a table."""
     client = get_dynamodb_client(region_name)
@@ -720,7 +721,7 @@ async def describe_continuous_backups(
 async def untag_resource(
     resource_arn: str = resource_arn,
     tag_keys: List[str] = Field(description='List of tags to remove.', min_length=1),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Removes tags from a DynamoDB resource."""
     client = get_dynamodb_client(region_name)
@@ -733,7 +734,7 @@ async def untag_resource(
 async def tag_resource(
     resource_arn: str = resource_arn,
     tags: List[Tag] = Field(description='Tags to be assigned.'),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Adds tags to a DynamoDB resource."""
     client = get_dynamodb_client(region_name)
@@ -748,7 +749,7 @@ async def list_tags_of_resource(
     next_token: str = Field(
         default=None, description='The NextToken from the previous paginated call'
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Returns tags for a DynamoDB resource."""
     client = get_dynamodb_client(region_name)
@@ -764,7 +765,7 @@ async def list_tags_of_resource(
 @handle_exceptions
 async def delete_table(
     table_name: str = table_name,
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """The DeleteTable operation deletes a table and all of its items. This is an asynchronous operation that puts the table into DELETING state until DynamoDB completes the deletion."""
     client = get_dynamodb_client(region_name)
@@ -783,7 +784,7 @@ async def update_continuous_backups(
         default=None,
         description='Number of days to retain point in time recovery backups.',
     ),
-    region_name: str = Field(default=None, description='The aws region to run the tool'),
+    region_name: str = region_name,
 ) -> dict:
     """Enables or disables point in time recovery for the specified table."""
     client = get_dynamodb_client(region_name)
@@ -16,11 +16,34 @@ This module provides functionality for searching GitHub repositories using the G
 import backoff
 import os
 import requests
+import threading
 import time
 from loguru import logger
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
+# Per-thread HTTP sessions so consecutive GitHub API calls reuse pooled keep-alive connections
+# instead of paying a new TCP and TLS handshake per request. Searches run in worker threads and
+# requests.Session is not thread-safe, so each thread keeps its own session.
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return the HTTP session for the current thread, creating it on first use."""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
+# REST search responses keyed by request URL, stored with their ETag so repeated searches can
+# be revalidated with If-None-Match. A 304 reply carries no body and does not count against
+# the GitHub rate limit. Searches run in worker threads, so access goes through the lock.
+REST_SEARCH_CACHE_MAX_ENTRIES = 128
+_rest_search_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+_rest_search_cache_lock = threading.Lock()
+
 # GitHub GraphQL API query for repository search
 GITHUB_GRAPHQL_QUERY = """
 query SearchRepositories($query: String!, $numResults: Int!) {
@@ -95,7 +118,7 @@ def github_graphql_request(
         headers['Authorization'] = f'Bearer {token}'
 
     try:
-        response = requests.post(
+        response = _get_session().post(
             'https://api.github.com/graphql',
             headers=headers,
             json={'query': query, 'variables': variables},
@@ -332,18 +355,42 @@ def github_repo_search_rest(
 
             logger.info(f'Searching GitHub REST API for org {org}')
 
+            url = f'https://api.github.com/search/repositories?q={query_string}&sort=stars&order=desc&per_page={num_results}'
+            headers = {'Accept': 'application/vnd.github.v3+json'}
+
+            # Revalidate a previous response for the same search instead of downloading it again
+            with _rest_search_cache_lock:
+                cached = _rest_search_cache.get(url)
+            if cached:
+                headers['If-None-Match'] = cached[0]
+
             # Make the REST API request
-            response = requests.get(
-                f'https://api.github.com/search/repositories?q={query_string}&sort=stars&order=desc&per_page={num_results}',
-                headers={'Accept': 'application/vnd.github.v3+json'},
+            response = _get_session().get(
+                url,
+                headers=headers,
                 timeout=10,  # Add 10 second timeout to prevent hanging requests
             )
 
-            # Check for errors
-            response.raise_for_status()
+            if cached and response.status_code == 304:
+                data = cached[1]
+            else:
+                # Check for errors
+                response.raise_for_status()
+
+                # Parse the response
+                data = response.json()
+
+                etag = response.headers.get('ETag')
+                if etag:
+                    with _rest_search_cache_lock:
+                        if (
+                            url not in _rest_search_cache
+                            and len(_rest_search_cache) >= REST_SEARCH_CACHE_MAX_ENTRIES
+                        ):
+                            # Evict the oldest entry
+                            _rest_search_cache.pop(next(iter(_rest_search_cache)))
+                        _rest_search_cache[url] = (etag, data)
 
-            # Parse the response
-            data = response.json()
             items = data.get('items', [])
 
             # Process each repository
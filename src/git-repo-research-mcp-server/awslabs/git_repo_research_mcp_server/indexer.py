@@ -34,6 +34,7 @@ from awslabs.git_repo_research_mcp_server.repository import (
     is_git_url,
     process_repository,
 )
+from awslabs.git_repo_research_mcp_server.utils import sanitize_repository_name
 from datetime import datetime
 from git import Repo
 from langchain_community.docstore.in_memory import InMemoryDocstore
@@ -315,7 +316,7 @@ class RepositoryIndexer:
             Path to the index directory
         """
         # Sanitize the repository name for use in a filename
-        sanitized_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in repository_name)
+        sanitized_name = sanitize_repository_name(repository_name)
         return os.path.join(self.index_dir, sanitized_name)
 
     def _get_metadata_path(self, repository_name: str) -> str:
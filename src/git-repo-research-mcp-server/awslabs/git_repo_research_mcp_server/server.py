@@ -11,26 +11,22 @@
 """awslabs git-repo-research MCP Server implementation."""
 
 import argparse
+import asyncio
 import json
 import mimetypes
 import os
 import sys
+import threading
 from awslabs.git_repo_research_mcp_server.defaults import Constants
 from awslabs.git_repo_research_mcp_server.github_search import (
     github_repo_search_wrapper,
 )
-from awslabs.git_repo_research_mcp_server.indexer import (
-    IndexConfig,
-    RepositoryConfig,
-    get_repository_indexer,
-)
 from awslabs.git_repo_research_mcp_server.models import (
     DeleteRepositoryResponse,
     EmbeddingModel,
     GitHubRepoSearchResponse,
     GitHubRepoSearchResult,
 )
-from awslabs.git_repo_research_mcp_server.search import get_repository_searcher
 from awslabs.git_repo_research_mcp_server.utils import (
     DateTimeEncoder,
     delete_indexed_repository,
@@ -227,6 +223,13 @@ async def mcp_index_repository(
         aws_region = os.environ.get('AWS_REGION')
         aws_profile = os.environ.get('AWS_PROFILE')
 
+        # The indexer pulls in faiss and langchain, so only import it once a tool needs it
+        from awslabs.git_repo_research_mcp_server.indexer import (
+            IndexConfig,
+            RepositoryConfig,
+            get_repository_indexer,
+        )
+
         index_config = IndexConfig(
             embedding_model=embedding_model, aws_region=aws_region, aws_profile=aws_profile
         )
@@ -294,7 +297,9 @@ async def repository_summary(repository_name: str) -> str:
         aws_region = os.environ.get('AWS_REGION')
         aws_profile = os.environ.get('AWS_PROFILE')
 
-        # Get the repository searcher
+        # Get the repository searcher (imported lazily, it depends on the indexer)
+        from awslabs.git_repo_research_mcp_server.search import get_repository_searcher
+
         searcher = get_repository_searcher(
             aws_region=aws_region,
             aws_profile=aws_profile,
@@ -499,7 +504,9 @@ async def access_file_or_directory(filepath: str) -> Union[str, List[str], Image
                 aws_region = os.environ.get('AWS_REGION')
                 aws_profile = os.environ.get('AWS_PROFILE')
 
-                # Get the repository searcher
+                # Get the repository searcher (imported lazily, it depends on the indexer)
+                from awslabs.git_repo_research_mcp_server.search import get_repository_searcher
+
                 searcher = get_repository_searcher(
                     aws_region=aws_region,
                     aws_profile=aws_profile,
@@ -635,7 +642,9 @@ async def mcp_search_repository(
         aws_region = os.environ.get('AWS_REGION')
         aws_profile = os.environ.get('AWS_PROFILE')
 
-        # Get the repository searcher
+        # Get the repository searcher (imported lazily, it depends on the indexer)
+        from awslabs.git_repo_research_mcp_server.search import get_repository_searcher
+
         searcher = get_repository_searcher(
             aws_region=aws_region,
             aws_profile=aws_profile,
@@ -710,8 +719,9 @@ async def mcp_search_github_repos(
         organizations = ['aws-samples', 'aws-solutions-library-samples', 'awslabs']
         license_filter = ['Apache License 2.0', 'MIT', 'MIT No Attribution']
 
-        # Call the search function
-        results = github_repo_search_wrapper(
+        # Call the search function in a worker thread, the HTTP calls and rate-limit waits block
+        results = await asyncio.to_thread(
+            github_repo_search_wrapper,
             keywords=keywords,
             organizations=organizations,
             num_results=num_results,
@@ -892,6 +902,18 @@ async def mcp_delete_repository(
         raise
 
 
+def _preload_search_modules() -> None:
+    """Import the indexer and searcher so the first tool call that needs them is not slowed down.
+
+    The tools import these modules lazily to keep server startup fast. This runs on a background
+    thread while the server starts, so the imports are usually done before the first request.
+    """
+    try:
+        import awslabs.git_repo_research_mcp_server.search  # noqa: F401
+    except Exception as e:
+        logger.warning(f'Failed to preload search modules: {e}')
+
+
 def main():
     """Run the MCP server with CLI argument support."""
     parser = argparse.ArgumentParser(
@@ -902,6 +924,10 @@ def main():
 
     args = parser.parse_args()
 
+    # Set MCP_WARMUP=0 to skip preloading, e.g. for short-lived invocations
+    if os.environ.get('MCP_WARMUP', '1') == '1':
+        threading.Thread(target=_preload_search_modules, daemon=True).start()
+
     # Run server with appropriate transport
     if args.sse:
         mcp.settings.port = args.port
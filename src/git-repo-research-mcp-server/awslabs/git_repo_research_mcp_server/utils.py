@@ -15,6 +15,7 @@ This module provides utility functions for the Git Repository Research MCP Serve
 
 import json
 import os
+import re
 import shutil
 from awslabs.git_repo_research_mcp_server.defaults import Constants
 from awslabs.git_repo_research_mcp_server.models import (
@@ -24,9 +25,29 @@ from awslabs.git_repo_research_mcp_server.models import (
     IndexedRepositoryInfo,
     IndexMetadata,
 )
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from loguru import logger
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+
+# Parsed metadata files keyed by path, along with the mtime they were parsed at
+_METADATA_CACHE: Dict[str, Tuple[int, IndexMetadata]] = {}
+
+# Characters that are not allowed in an index directory name (\w is Unicode alphanumerics and _)
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w-]')
+
+
+def sanitize_repository_name(repository_name: str) -> str:
+    """Sanitize a repository name for use as an index directory name.
+
+    Args:
+        repository_name: Name of the repository
+
+    Returns:
+        The name with every character other than alphanumerics, '-' and '_' replaced by '_'
+    """
+    return _UNSAFE_NAME_CHARS.sub('_', repository_name)
 
 
 def get_default_index_dir() -> str:
@@ -49,18 +70,38 @@ def load_metadata(metadata_path: str) -> Optional[IndexMetadata]:
     Returns:
         IndexMetadata object if the file exists and is valid, None otherwise
     """
-    if not os.path.exists(metadata_path):
-        return None
-
     try:
-        with open(metadata_path, 'r') as f:
-            metadata_dict = json.load(f)
-        return IndexMetadata(**metadata_dict)
+        # Metadata only changes when a repository is re-indexed, so reuse the parsed
+        # object for as long as the file's modification time stays the same
+        mtime_ns = os.stat(metadata_path).st_mtime_ns
+        cached = _METADATA_CACHE.get(metadata_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        # Validate straight from the raw JSON rather than building an intermediate dict
+        with open(metadata_path, 'rb') as f:
+            metadata = IndexMetadata.model_validate_json(f.read())
+        _METADATA_CACHE[metadata_path] = (mtime_ns, metadata)
+        return metadata
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error(f'Error loading metadata from {metadata_path}: {e}')
         return None
 
 
+def _load_repository_metadata(dir_path: str) -> Optional[IndexMetadata]:
+    """Load the metadata.json file of a repository index directory.
+
+    Args:
+        dir_path: Path to the repository index directory
+
+    Returns:
+        IndexMetadata object if the directory contains valid metadata, None otherwise
+    """
+    return load_metadata(os.path.join(dir_path, 'metadata.json'))
+
+
 def list_indexed_repositories(
     index_dir: Optional[str] = None, detailed: bool = False
 ) -> Union[IndexedRepositoriesResponse, DetailedIndexedRepositoriesResponse]:
@@ -92,59 +133,59 @@ def list_indexed_repositories(
     repositories = []
     total_index_size = 0
 
-    # Look for repository directories in the index directory
-    for dirname in os.listdir(index_dir):
-        dir_path = os.path.join(index_dir, dirname)
-        if os.path.isdir(dir_path):
-            # Check if this directory contains a metadata.json file
-            metadata_path = os.path.join(dir_path, 'metadata.json')
-            if os.path.exists(metadata_path):
-                metadata = load_metadata(metadata_path)
-                if metadata is None:
-                    continue
-            else:
-                continue  # Skip directories without metadata.json
-
-            # Check if repository directory exists
-            repo_files_path = os.path.join(metadata.index_path, 'repository')
-            repository_directory = None
-            if os.path.exists(repo_files_path) and os.path.isdir(repo_files_path):
-                repository_directory = repo_files_path
-
-            # At this point, metadata is guaranteed to be not None
-            if detailed:
-                # Create a detailed repository info object
-                repo_info = DetailedIndexedRepositoryInfo(
-                    repository_name=metadata.repository_name,
-                    repository_path=metadata.repository_path,
-                    index_path=metadata.index_path,
-                    repository_directory=repository_directory,
-                    created_at=metadata.created_at,
-                    last_accessed=metadata.last_accessed,
-                    file_count=metadata.file_count,
-                    embedding_model=metadata.embedding_model,
-                    chunk_count=metadata.chunk_count,
-                    file_types=metadata.file_types,
-                    total_tokens=metadata.total_tokens,
-                    index_size_bytes=metadata.index_size_bytes,
-                    last_commit_id=metadata.last_commit_id,
-                )
-                if metadata.index_size_bytes:
-                    total_index_size += metadata.index_size_bytes
-            else:
-                # Create a basic repository info object
-                repo_info = IndexedRepositoryInfo(
-                    repository_name=metadata.repository_name,
-                    repository_path=metadata.repository_path,
-                    index_path=metadata.index_path,
-                    repository_directory=repository_directory,
-                    created_at=metadata.created_at,
-                    last_accessed=metadata.last_accessed,
-                    file_count=metadata.file_count,
-                    embedding_model=metadata.embedding_model,
-                )
-
-            repositories.append(repo_info)
+    # Look for repository directories in the index directory. scandir reports the
+    # entry type from the directory listing itself, so no extra stat per entry.
+    with os.scandir(index_dir) as entries:
+        repository_dirs = sorted(entry.path for entry in entries if entry.is_dir())
+
+    # Each metadata file is independent, so read them concurrently; map keeps the order
+    with ThreadPoolExecutor() as executor:
+        all_metadata = list(executor.map(_load_repository_metadata, repository_dirs))
+
+    for metadata in all_metadata:
+        if metadata is None:
+            continue  # Skip directories without a valid metadata.json
+
+        # Check if repository directory exists
+        repo_files_path = os.path.join(metadata.index_path, 'repository')
+        repository_directory = None
+        if os.path.exists(repo_files_path) and os.path.isdir(repo_files_path):
+            repository_directory = repo_files_path
+
+        # At this point, metadata is guaranteed to be not None
+        if detailed:
+            # Create a detailed repository info object
+            repo_info = DetailedIndexedRepositoryInfo(
+                repository_name=metadata.repository_name,
+                repository_path=metadata.repository_path,
+                index_path=metadata.index_path,
+                repository_directory=repository_directory,
+                created_at=metadata.created_at,
+                last_accessed=metadata.last_accessed,
+                file_count=metadata.file_count,
+                embedding_model=metadata.embedding_model,
+                chunk_count=metadata.chunk_count,
+                file_types=metadata.file_types,
+                total_tokens=metadata.total_tokens,
+                index_size_bytes=metadata.index_size_bytes,
+                last_commit_id=metadata.last_commit_id,
+            )
+            if metadata.index_size_bytes:
+                total_index_size += metadata.index_size_bytes
+        else:
+            # Create a basic repository info object
+            repo_info = IndexedRepositoryInfo(
+                repository_name=metadata.repository_name,
+                repository_path=metadata.repository_path,
+                index_path=metadata.index_path,
+                repository_directory=repository_directory,
+                created_at=metadata.created_at,
+                last_accessed=metadata.last_accessed,
+                file_count=metadata.file_count,
+                embedding_model=metadata.embedding_model,
+            )
+
+        repositories.append(repo_info)
 
     if detailed:
         return DetailedIndexedRepositoriesResponse(
@@ -228,7 +269,7 @@ async def delete_indexed_repository(
         # It's a repository name, find the corresponding index directory
         repository_name = repository_name_or_path
         # Sanitize the repository name for use in a directory name
-        safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in repository_name)
+        safe_name = sanitize_repository_name(repository_name)
         index_path = os.path.join(index_dir, safe_name)
         metadata_path = os.path.join(index_path, 'metadata.json')
 
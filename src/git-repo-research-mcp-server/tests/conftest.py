@@ -11,6 +11,7 @@
 """Configuration for pytest."""
 
 import pytest
+from awslabs.git_repo_research_mcp_server import github_search
 
 
 def pytest_addoption(parser):
@@ -48,3 +49,11 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if 'github' in item.keywords:
                 item.add_marker(skip_github)
+
+
+@pytest.fixture(autouse=True)
+def clear_rest_search_cache():
+    """Start every test with an empty GitHub REST search cache."""
+    github_search._rest_search_cache.clear()
+    yield
+    github_search._rest_search_cache.clear()
@@ -12,7 +12,10 @@
 
 import pytest
 import requests
+import threading
+from awslabs.git_repo_research_mcp_server import github_search
 from awslabs.git_repo_research_mcp_server.github_search import (
+    _get_session,
     clean_github_url,
     extract_org_from_url,
     github_graphql_request,
@@ -44,7 +47,7 @@ async def test_graphql_request_rate_limit():
 
     current_time = int(time_module.time())
 
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         mock_response = MagicMock()
         mock_response.status_code = 403
         mock_response.text = 'API rate limit exceeded'
@@ -58,7 +61,7 @@ async def test_graphql_request_rate_limit():
 
 def test_github_graphql_request_rate_limit_no_token():
     """Test GitHub GraphQL request function with rate limiting and no token."""
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         # Configure the mock for rate limit response with no token
         rate_limit_response = MagicMock()
         rate_limit_response.status_code = 403
@@ -79,7 +82,7 @@ def test_github_graphql_request_rate_limit_no_token():
 
 def test_github_graphql_request_http_error():
     """Test GitHub GraphQL request function with HTTP error."""
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         # Configure the mock to raise an HTTP error
         mock_post.side_effect = requests.exceptions.HTTPError('404 Client Error')
 
@@ -94,7 +97,7 @@ def test_github_graphql_request_http_error():
 
 def test_github_graphql_request_auth_failure():
     """Test GitHub GraphQL request function with authentication failure."""
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         # Configure the mock for auth failure response
         auth_failure = MagicMock()
         auth_failure.status_code = 401
@@ -120,7 +123,7 @@ def test_github_graphql_request_auth_failure():
 
 def test_github_graphql_request_connection_error():
     """Test GitHub GraphQL request function with connection error."""
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         # Configure the mock to raise a connection error
         mock_post.side_effect = requests.exceptions.ConnectionError('Connection refused')
 
@@ -315,7 +318,7 @@ def test_github_repo_search_rest_with_exception():
     # if os.environ.get('CI') == 'true':
     #     pytest.skip('Skipping GitHub API test in CI environment')
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         # Configure the mock to raise an exception
         mock_get.side_effect = Exception('Test exception')
 
@@ -337,7 +340,7 @@ def test_github_repo_search_rest_with_http_error():
     # if os.environ.get('CI') == 'true':
     #     pytest.skip('Skipping GitHub API test in CI environment')
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         # Configure the mock to raise an HTTP error
         mock_get.side_effect = requests.exceptions.HTTPError('404 Client Error')
 
@@ -359,7 +362,7 @@ def test_github_repo_search_rest_with_duplicate_urls():
     # if os.environ.get('CI') == 'true':
     #     pytest.skip('Skipping GitHub API test in CI environment')
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         # Configure the mock to return duplicate URLs across different orgs
         mock_response1 = MagicMock()
         mock_response1.json.return_value = {
@@ -423,7 +426,7 @@ def test_github_repo_search_rest_with_license_filter():
     # if os.environ.get('CI') == 'true':
     #     pytest.skip('Skipping GitHub API test in CI environment')
 
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         # Configure the mock to return repos with different licenses
         mock_response = MagicMock()
         mock_response.json.return_value = {
@@ -473,6 +476,78 @@ def test_github_repo_search_rest_with_license_filter():
         assert results[0]['license'] == 'Apache License 2.0'
 
 
+def test_github_repo_search_rest_revalidates_with_etag():
+    """Test that a repeated REST search is revalidated with its ETag and served on 304."""
+    search_response = MagicMock()
+    search_response.status_code = 200
+    search_response.headers = {'ETag': '"abc123"'}
+    search_response.json.return_value = {
+        'items': [
+            {
+                'full_name': 'awslabs/mcp',
+                'html_url': 'https://github.com/awslabs/mcp',
+                'license': {'name': 'Apache License 2.0'},
+            }
+        ]
+    }
+    not_modified_response = MagicMock()
+    not_modified_response.status_code = 304
+
+    with (
+        patch.dict(github_search._rest_search_cache, clear=True),
+        patch('requests.Session.get') as mock_get,
+        patch('time.sleep'),
+    ):
+        mock_get.side_effect = [search_response, not_modified_response]
+
+        first = github_repo_search_rest(keywords=['mcp'], organizations=['awslabs'])
+        second = github_repo_search_rest(keywords=['mcp'], organizations=['awslabs'])
+
+        # The first request is unconditional, the second one sends the cached ETag
+        assert 'If-None-Match' not in mock_get.call_args_list[0].kwargs['headers']
+        assert mock_get.call_args_list[1].kwargs['headers']['If-None-Match'] == '"abc123"'
+
+        # The 304 response is answered from the cached search results
+        not_modified_response.json.assert_not_called()
+        assert second == first
+        assert second[0]['url'] == 'https://github.com/awslabs/mcp'
+
+
+def test_github_repo_search_rest_evicts_oldest_cached_search():
+    """Test that the REST search cache evicts its oldest entry once it is full."""
+    search_response = MagicMock()
+    search_response.status_code = 200
+    search_response.headers = {'ETag': '"abc123"'}
+    search_response.json.return_value = {'items': []}
+
+    with (
+        patch.dict(github_search._rest_search_cache, clear=True),
+        patch.object(github_search, 'REST_SEARCH_CACHE_MAX_ENTRIES', 2),
+        patch('requests.Session.get', return_value=search_response),
+        patch('time.sleep'),
+    ):
+        github_repo_search_rest(keywords=['mcp'], organizations=['org-a', 'org-b', 'org-c'])
+
+        cached_urls = list(github_search._rest_search_cache)
+        assert len(cached_urls) == 2
+        assert 'org:org-a' not in cached_urls[0]
+        assert 'org:org-b' in cached_urls[0]
+        assert 'org:org-c' in cached_urls[1]
+
+
+def test_get_session_is_per_thread():
+    """Test that each thread reuses its own HTTP session."""
+    sessions = []
+    worker = threading.Thread(target=lambda: sessions.extend([_get_session(), _get_session()]))
+    worker.start()
+    worker.join()
+
+    # Calls on the same thread share a session, other threads get their own
+    assert sessions[0] is sessions[1]
+    assert _get_session() is _get_session()
+    assert _get_session() is not sessions[0]
+
+
 @pytest.mark.github
 def test_github_repo_search_wrapper_with_string_keywords():
     """Test GitHub repository search wrapper with string keywords."""
@@ -176,7 +176,7 @@ def test_github_graphql_request(mock_graphql_response):
     # Skip in CI environment
     # if os.environ.get('CI') == 'true':
     #     pytest.skip('Skipping GitHub API test in CI environment')
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         # Configure the mock
         mock_response = MagicMock()
         mock_response.json.return_value = mock_graphql_response
@@ -205,7 +205,7 @@ def test_github_graphql_request_rate_limit():
     # Skip in CI environment
     # if os.environ.get('CI') == 'true':
     #     pytest.skip('Skipping GitHub API test in CI environment')
-    with patch('requests.post') as mock_post, patch('time.sleep') as mock_sleep:
+    with patch('requests.Session.post') as mock_post, patch('time.sleep') as mock_sleep:
         # Configure the mock for rate limit response
         rate_limit_response = MagicMock()
         rate_limit_response.status_code = 403
@@ -307,7 +307,7 @@ def test_github_repo_search_rest(mock_rest_response):
     # Skip in CI environment
     # if os.environ.get('CI') == 'true':
     #     pytest.skip('Skipping GitHub API test in CI environment')
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         # Configure the mock
         mock_response = MagicMock()
         mock_response.json.return_value = mock_rest_response
@@ -11,6 +11,7 @@
 """Tests for Git Repository Research MCP Server utility functions."""
 
 import json
+import os
 import pytest
 from awslabs.git_repo_research_mcp_server.defaults import Constants
 from awslabs.git_repo_research_mcp_server.models import (
@@ -22,9 +23,10 @@ from awslabs.git_repo_research_mcp_server.utils import (
     get_default_index_dir,
     list_indexed_repositories,
     load_metadata,
+    sanitize_repository_name,
 )
 from datetime import datetime
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, patch
 
 
 def test_get_default_index_dir():
@@ -44,23 +46,20 @@ def test_get_default_index_dir():
         mock_makedirs.assert_called_once_with('/home/user/.git_repo_research', exist_ok=True)
 
 
-def test_load_metadata_file_not_exists():
+def test_load_metadata_file_not_exists(tmp_path):
     """Test loading metadata when the file doesn't exist."""
-    with patch('os.path.exists') as mock_exists:
-        # Configure the mock
-        mock_exists.return_value = False
-
+    with patch('loguru.logger.error') as mock_logger_error:
         # Call the function
-        result = load_metadata('/path/to/metadata.json')
+        result = load_metadata(str(tmp_path / 'metadata.json'))
 
         # Verify the result
         assert result is None
 
-        # Verify the mock was called correctly
-        mock_exists.assert_called_once_with('/path/to/metadata.json')
+        # A missing file is not an error
+        mock_logger_error.assert_not_called()
 
 
-def test_load_metadata_valid_file():
+def test_load_metadata_valid_file(tmp_path):
     """Test loading metadata from a valid file."""
     metadata_dict = {
         'repository_name': 'test-repo',
@@ -77,53 +76,74 @@ def test_load_metadata_valid_file():
         'last_commit_id': 'abc123',
     }
 
-    with (
-        patch('os.path.exists') as mock_exists,
-        patch('builtins.open', mock_open(read_data=json.dumps(metadata_dict))),
-    ):
-        # Configure the mock
-        mock_exists.return_value = True
+    metadata_path = tmp_path / 'metadata.json'
+    metadata_path.write_text(json.dumps(metadata_dict))
+
+    # Call the function
+    result = load_metadata(str(metadata_path))
+
+    # Verify the result
+    assert result is not None
+    assert isinstance(result, IndexMetadata)
+    assert result.repository_name == 'test-repo'
+    assert result.repository_path == '/path/to/repo'
+    assert result.index_path == '/path/to/index'
+    assert result.file_count == 10
+    assert result.embedding_model == 'amazon.titan-embed-text-v2:0'
+    assert result.chunk_count == 20
+    assert result.file_types == {'py': 5, 'md': 5}
+    assert result.total_tokens == 1000
+    assert result.index_size_bytes == 5000
+    assert result.last_commit_id == 'abc123'
+
+
+def test_load_metadata_reuses_parsed_file_until_modified(tmp_path):
+    """Test that metadata is only re-parsed when the file's mtime changes."""
+    metadata_dict = {
+        'repository_name': 'test-repo',
+        'repository_path': '/path/to/repo',
+        'index_path': '/path/to/index',
+        'created_at': '2023-01-01T00:00:00Z',
+        'last_accessed': '2023-01-02T00:00:00Z',
+        'file_count': 10,
+        'embedding_model': 'amazon.titan-embed-text-v2:0',
+    }
+    metadata_path = tmp_path / 'metadata.json'
+    metadata_path.write_text(json.dumps(metadata_dict))
 
-        # Call the function
-        result = load_metadata('/path/to/metadata.json')
+    first = load_metadata(str(metadata_path))
+    assert first is not None
+    with patch('builtins.open') as mock_file:
+        second = load_metadata(str(metadata_path))
+        mock_file.assert_not_called()
+    assert second is first
 
-        # Verify the result
-        assert result is not None
-        assert isinstance(result, IndexMetadata)
-        assert result.repository_name == 'test-repo'
-        assert result.repository_path == '/path/to/repo'
-        assert result.index_path == '/path/to/index'
-        assert result.file_count == 10
-        assert result.embedding_model == 'amazon.titan-embed-text-v2:0'
-        assert result.chunk_count == 20
-        assert result.file_types == {'py': 5, 'md': 5}
-        assert result.total_tokens == 1000
-        assert result.index_size_bytes == 5000
-        assert result.last_commit_id == 'abc123'
-
-
-def test_load_metadata_invalid_file():
+    # Rewrite the file with a different modification time
+    metadata_dict['file_count'] = 20
+    metadata_path.write_text(json.dumps(metadata_dict))
+    os.utime(metadata_path, ns=(0, 1_000_000_000))
+
+    third = load_metadata(str(metadata_path))
+    assert third is not first
+    assert third is not None
+    assert third.file_count == 20
+
+
+def test_load_metadata_invalid_file(tmp_path):
     """Test loading metadata from an invalid file."""
-    with (
-        patch('os.path.exists') as mock_exists,
-        patch('builtins.open', mock_open(read_data='invalid json')),
-        patch('loguru.logger.error') as mock_logger_error,
-    ):
-        # Configure the mock
-        mock_exists.return_value = True
+    metadata_path = tmp_path / 'metadata.json'
+    metadata_path.write_text('invalid json')
 
+    with patch('loguru.logger.error') as mock_logger_error:
         # Call the function
-        result = load_metadata('/path/to/metadata.json')
+        result = load_metadata(str(metadata_path))
 
         # Verify the result
         assert result is None
 
         # Verify the logger was called
         mock_logger_error.assert_called_once()
-        assert (
-            'Error loading metadata from /path/to/metadata.json'
-            in mock_logger_error.call_args[0][0]
-        )
+        assert f'Error loading metadata from {metadata_path}' in mock_logger_error.call_args[0][0]
 
 
 def test_list_indexed_repositories_empty_dir():
@@ -147,27 +167,21 @@ def test_list_indexed_repositories_empty_dir():
         assert result.index_directory == '/home/user/.git_repo_research'
 
 
-def test_list_indexed_repositories_with_repositories():
+def test_list_indexed_repositories_with_repositories(tmp_path):
     """Test listing indexed repositories when there are repositories."""
     with (
         patch(
             'awslabs.git_repo_research_mcp_server.utils.get_default_index_dir'
         ) as mock_get_default_index_dir,
         patch('os.path.exists') as mock_exists,
-        patch('os.listdir') as mock_listdir,
-        patch('os.path.isdir') as mock_isdir,
         patch('awslabs.git_repo_research_mcp_server.utils.load_metadata') as mock_load_metadata,
     ):
         # Configure the mocks
-        mock_get_default_index_dir.return_value = '/home/user/.git_repo_research'
+        mock_get_default_index_dir.return_value = str(tmp_path)
         mock_exists.return_value = True
-        mock_listdir.return_value = ['repo1', 'repo2', 'not_a_repo']
-
-        # Configure isdir to return True for repo1 and repo2, False for not_a_repo
-        def mock_isdir_side_effect(path):
-            return 'not_a_repo' not in path
-
-        mock_isdir.side_effect = mock_isdir_side_effect
+        (tmp_path / 'repo1').mkdir()
+        (tmp_path / 'repo2').mkdir()
+        (tmp_path / 'not_a_repo').write_text('')
 
         # Configure load_metadata to return metadata for repo1 and repo2
         metadata1 = IndexMetadata(
@@ -216,7 +230,7 @@ def test_list_indexed_repositories_with_repositories():
         # Verify the result
         assert len(result.repositories) == 2
         assert result.total_count == 2
-        assert result.index_directory == '/home/user/.git_repo_research'
+        assert result.index_directory == str(tmp_path)
 
         # Verify the repositories
         assert result.repositories[0].repository_name == 'repo1'
@@ -230,22 +244,21 @@ def test_list_indexed_repositories_with_repositories():
         assert result.repositories[1].file_count == 5
 
 
-def test_list_indexed_repositories_with_missing_metadata():
+def test_list_indexed_repositories_with_missing_metadata(tmp_path):
     """Test listing indexed repositories when metadata is missing or invalid."""
     with (
         patch(
             'awslabs.git_repo_research_mcp_server.utils.get_default_index_dir'
         ) as mock_get_default_index_dir,
         patch('os.path.exists') as mock_exists,
-        patch('os.listdir') as mock_listdir,
-        patch('os.path.isdir') as mock_isdir,
         patch('awslabs.git_repo_research_mcp_server.utils.load_metadata') as mock_load_metadata,
     ):
         # Configure the mocks
-        mock_get_default_index_dir.return_value = '/home/user/.git_repo_research'
+        mock_get_default_index_dir.return_value = str(tmp_path)
         mock_exists.return_value = True
-        mock_listdir.return_value = ['repo1', 'repo2', 'repo3']
-        mock_isdir.return_value = True
+        (tmp_path / 'repo1').mkdir()
+        (tmp_path / 'repo2').mkdir()
+        (tmp_path / 'repo3').mkdir()
 
         # Configure load_metadata to return None for repo1 (missing metadata)
         # and valid metadata for repo2
@@ -286,22 +299,19 @@ def test_list_indexed_repositories_with_missing_metadata():
         assert result.repositories[0].repository_name == 'repo2'
 
 
-def test_list_indexed_repositories_detailed():
+def test_list_indexed_repositories_detailed(tmp_path):
     """Test listing indexed repositories with detailed information."""
     with (
         patch(
             'awslabs.git_repo_research_mcp_server.utils.get_default_index_dir'
         ) as mock_get_default_index_dir,
         patch('os.path.exists') as mock_exists,
-        patch('os.listdir') as mock_listdir,
-        patch('os.path.isdir') as mock_isdir,
         patch('awslabs.git_repo_research_mcp_server.utils.load_metadata') as mock_load_metadata,
     ):
         # Configure the mocks
-        mock_get_default_index_dir.return_value = '/home/user/.git_repo_research'
+        mock_get_default_index_dir.return_value = str(tmp_path)
         mock_exists.return_value = True
-        mock_listdir.return_value = ['repo1']
-        mock_isdir.return_value = True
+        (tmp_path / 'repo1').mkdir()
 
         # Configure load_metadata to return metadata
         metadata = IndexMetadata(
@@ -327,7 +337,7 @@ def test_list_indexed_repositories_detailed():
         # Verify the result
         assert len(result.repositories) == 1
         assert result.total_count == 1
-        assert result.index_directory == '/home/user/.git_repo_research'
+        assert result.index_directory == str(tmp_path)
 
         # Verify the repository details
         repo = result.repositories[0]
@@ -353,6 +363,19 @@ def test_format_size():
     assert format_size(1500000000) == '1.40 GB'
 
 
+def test_sanitize_repository_name():
+    """Test sanitizing repository names for use as index directory names."""
+    # Alphanumerics, '-' and '_' are kept
+    assert sanitize_repository_name('my-repo_2') == 'my-repo_2'
+
+    # Everything else is replaced with '_'
+    assert sanitize_repository_name('aws-samples/my.repo') == 'aws-samples_my_repo'
+    assert sanitize_repository_name('../etc passwd') == '___etc_passwd'
+
+    # Unicode alphanumerics are kept, as with str.isalnum
+    assert sanitize_repository_name('dépôt') == 'dépôt'
+
+
 @pytest.mark.asyncio
 async def test_delete_indexed_repository_not_found():
     """Test deleting a repository that doesn't exist."""
@@ -580,21 +603,20 @@ async def test_delete_indexed_repository_complete_failure():
         mock_logger_error.assert_called()  # Error logging should occur
 
 
-def test_list_indexed_repositories_with_repository_directory():
+def test_list_indexed_repositories_with_repository_directory(tmp_path):
     """Test listing indexed repositories with repository directory."""
     with (
         patch(
             'awslabs.git_repo_research_mcp_server.utils.get_default_index_dir'
         ) as mock_get_default_index_dir,
         patch('os.path.exists') as mock_exists,
-        patch('os.listdir') as mock_listdir,
         patch('os.path.isdir') as mock_isdir,
         patch('awslabs.git_repo_research_mcp_server.utils.load_metadata') as mock_load_metadata,
     ):
         # Configure the mocks
-        mock_get_default_index_dir.return_value = '/home/user/.git_repo_research'
+        mock_get_default_index_dir.return_value = str(tmp_path)
         mock_exists.return_value = True
-        mock_listdir.return_value = ['repo1']
+        (tmp_path / 'repo1').mkdir()
         mock_isdir.return_value = True
 
         # Configure load_metadata to return metadata
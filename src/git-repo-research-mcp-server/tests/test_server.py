@@ -15,6 +15,7 @@ import json
 import os
 import pytest
 import subprocess
+import sys
 import tempfile
 from awslabs.git_repo_research_mcp_server.models import (
     EmbeddingModel,
@@ -22,6 +23,7 @@ from awslabs.git_repo_research_mcp_server.models import (
 
 # Import the server functionality
 from awslabs.git_repo_research_mcp_server.server import (
+    _preload_search_modules,
     access_file_or_directory,
     list_repositories,
     main,
@@ -732,17 +734,22 @@ async def test_mcp_access_file(test_context):
         assert 'Test exception' in str(excinfo.value)
 
 
-def test_main():
+def test_main(monkeypatch):
     """Test the main function."""
+    monkeypatch.delenv('MCP_WARMUP', raising=False)
+
     # Mock the argparse.ArgumentParser
     with (
         patch('argparse.ArgumentParser.parse_args') as mock_parse_args,
         patch('awslabs.git_repo_research_mcp_server.server.mcp.run') as mock_run,
+        patch('awslabs.git_repo_research_mcp_server.server.threading.Thread') as mock_thread,
     ):
         # Test with default arguments
         mock_parse_args.return_value = argparse.Namespace(sse=False, port=8888)
         main()
         mock_run.assert_called_once()
+        mock_thread.assert_called_once_with(target=_preload_search_modules, daemon=True)
+        mock_thread.return_value.start.assert_called_once()
 
         # Reset mocks
         mock_run.reset_mock()
@@ -752,3 +759,30 @@ def test_main():
         main()
         assert mcp.settings.port == 9999, 'Port not set correctly'
         mock_run.assert_called_once_with(transport='sse')
+
+
+def test_main_without_warmup(monkeypatch):
+    """Test that MCP_WARMUP=0 skips preloading the search modules."""
+    monkeypatch.setenv('MCP_WARMUP', '0')
+
+    with (
+        patch('argparse.ArgumentParser.parse_args') as mock_parse_args,
+        patch('awslabs.git_repo_research_mcp_server.server.mcp.run') as mock_run,
+        patch('awslabs.git_repo_research_mcp_server.server.threading.Thread') as mock_thread,
+    ):
+        mock_parse_args.return_value = argparse.Namespace(sse=False, port=8888)
+        main()
+        mock_run.assert_called_once()
+        mock_thread.assert_not_called()
+
+
+def test_preload_search_modules_logs_import_failure():
+    """Test that a failed preload is logged as a warning instead of raised."""
+    with (
+        patch.dict(sys.modules, {'awslabs.git_repo_research_mcp_server.search': None}),
+        patch('awslabs.git_repo_research_mcp_server.server.logger') as mock_logger,
+    ):
+        _preload_search_modules()
+
+    mock_logger.warning.assert_called_once()
+    assert 'Failed to preload search modules' in mock_logger.warning.call_args.args[0]
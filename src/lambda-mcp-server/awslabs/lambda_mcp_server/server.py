@@ -1,11 +1,13 @@
 """awslabs lambda MCP Server implementation."""
 
 import argparse
+import asyncio
 import boto3
 import json
 import logging
 import os
 import re
+from botocore.config import Config
 from mcp.server.fastmcp import Context, FastMCP
 from typing import Optional
 
@@ -15,34 +17,41 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 AWS_PROFILE = os.environ.get('AWS_PROFILE', 'default')
-logger.info(f'AWS_PROFILE: {AWS_PROFILE}')
+logger.info('AWS_PROFILE: %s', AWS_PROFILE)
 
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
-logger.info(f'AWS_REGION: {AWS_REGION}')
+logger.info('AWS_REGION: %s', AWS_REGION)
 
 FUNCTION_PREFIX = os.environ.get('FUNCTION_PREFIX', '')
-logger.info(f'FUNCTION_PREFIX: {FUNCTION_PREFIX}')
+logger.info('FUNCTION_PREFIX: %s', FUNCTION_PREFIX)
 
 FUNCTION_LIST = [
     function_name.strip()
     for function_name in os.environ.get('FUNCTION_LIST', '').split(',')
     if function_name.strip()
 ]
-logger.info(f'FUNCTION_LIST: {FUNCTION_LIST}')
+logger.info('FUNCTION_LIST: %s', FUNCTION_LIST)
 
 FUNCTION_TAG_KEY = os.environ.get('FUNCTION_TAG_KEY', '')
-logger.info(f'FUNCTION_TAG_KEY: {FUNCTION_TAG_KEY}')
+logger.info('FUNCTION_TAG_KEY: %s', FUNCTION_TAG_KEY)
 
 FUNCTION_TAG_VALUE = os.environ.get('FUNCTION_TAG_VALUE', '')
-logger.info(f'FUNCTION_TAG_VALUE: {FUNCTION_TAG_VALUE}')
+logger.info('FUNCTION_TAG_VALUE: %s', FUNCTION_TAG_VALUE)
 
 FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY = os.environ.get('FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY')
-logger.info(f'FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY: {FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY}')
-
-# Initialize AWS clients
+logger.info('FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY: %s', FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY)
+
+# Initialize AWS clients once and share them across all tool calls. Invocations run in the
+# default thread pool (at most 32 workers), so size the connection pool to match instead of
+# botocore's default of 10, and keep idle connections alive between calls.
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'mode': 'standard'},
+    tcp_keepalive=True,
+)
 session = boto3.Session(profile_name=AWS_PROFILE, region_name=AWS_REGION)
-lambda_client = session.client('lambda')
-schemas_client = session.client('schemas')
+lambda_client = session.client('lambda', config=AWS_CLIENT_CONFIG)
+schemas_client = session.client('schemas', config=AWS_CLIENT_CONFIG)
 
 mcp = FastMCP(
     'awslabs.lambda-mcp-server',
@@ -85,7 +94,7 @@ def format_lambda_response(function_name: str, payload: bytes) -> str:
     try:
         # Try to parse the payload as JSON
         payload_json = json.loads(payload)
-        return f'Function {function_name} returned: {json.dumps(payload_json, indent=2)}'
+        return f'Function {function_name} returned: {json.dumps(payload_json)}'
     except (json.JSONDecodeError, UnicodeDecodeError):
         # Return raw payload if not JSON
         return f'Function {function_name} returned payload: {payload}'
@@ -95,7 +104,9 @@ async def invoke_lambda_function_impl(function_name: str, parameters: dict, ctx:
     """Tool that invokes an AWS Lambda function with a JSON payload."""
     await ctx.info(f'Invoking {function_name} with parameters: {parameters}')
 
-    response = lambda_client.invoke(
+    # boto3 calls block, so run them off the event loop to keep other requests responsive
+    response = await asyncio.to_thread(
+        lambda_client.invoke,
         FunctionName=function_name,
         InvocationType='RequestResponse',
         Payload=json.dumps(parameters),
@@ -110,7 +121,7 @@ async def invoke_lambda_function_impl(function_name: str, parameters: dict, ctx:
         await ctx.error(error_message)
         return error_message
 
-    payload = response['Payload'].read()
+    payload = await asyncio.to_thread(response['Payload'].read)
     # Format the response payload
     return format_lambda_response(function_name, payload)
 
@@ -129,12 +140,12 @@ def get_schema_from_registry(schema_arn: str) -> Optional[dict]:
         # ARN format: arn:aws:schemas:region:account:schema/registry-name/schema-name
         arn_parts = schema_arn.split(':')
         if len(arn_parts) < 6:
-            logger.error(f'Invalid schema ARN format: {schema_arn}')
+            logger.error('Invalid schema ARN format: %s', schema_arn)
             return None
 
         registry_schema = arn_parts[5].split('/')
         if len(registry_schema) != 3:
-            logger.error(f'Invalid schema path in ARN: {arn_parts[5]}')
+            logger.error('Invalid schema path in ARN: %s', arn_parts[5])
             return None
 
         registry_name = registry_schema[1]
@@ -150,7 +161,7 @@ def get_schema_from_registry(schema_arn: str) -> Optional[dict]:
         return response['Content']
 
     except Exception as e:
-        logger.error(f'Error fetching schema from registry: {e}')
+        logger.error('Error fetching schema from registry: %s', e)
         return None
 
 
@@ -178,13 +189,13 @@ def create_lambda_tool(function_name: str, description: str, schema_arn: Optiona
             #  We add the schema to the description because mcp.tool does not expose overriding the tool schema.
             description_with_schema = f'{description}\n\nInput Schema:\n{schema}'
             lambda_function.__doc__ = description_with_schema
-            logger.info(f'Added schema from registry to description for function {function_name}')
+            logger.info('Added schema from registry to description for function %s', function_name)
         else:
             lambda_function.__doc__ = description
     else:
         lambda_function.__doc__ = description
 
-    logger.info(f'Registering tool {tool_name} with description: {description}')
+    logger.info('Registering tool %s with description: %s', tool_name, description)
     # Apply the decorator manually with the specific name
     decorated_function = mcp.tool(name=tool_name)(lambda_function)
 
@@ -213,10 +224,12 @@ def get_schema_arn_from_function_arn(function_arn: str) -> Optional[str]:
             return tags[FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY]
         else:
             logger.info(
-                f'No schema arn provided for function {function_arn} via tag {FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY}'
+                'No schema arn provided for function %s via tag %s',
+                function_arn,
+                FUNCTION_INPUT_SCHEMA_ARN_TAG_KEY,
             )
     except Exception as e:
-        logger.warning(f'Error checking tags for function {function_arn}: {e}')
+        logger.warning('Error checking tags for function %s: %s', function_arn, e)
 
     return None
 
@@ -232,7 +245,7 @@ def filter_functions_by_tag(functions, tag_key, tag_value):
     Returns:
         List of Lambda functions that have the specified tag key-value pair
     """
-    logger.info(f'Filtering functions by tag key-value pair: {tag_key}={tag_value}')
+    logger.info('Filtering functions by tag key-value pair: %s=%s', tag_key, tag_value)
     tagged_functions = []
 
     for function in functions:
@@ -245,9 +258,11 @@ def filter_functions_by_tag(functions, tag_key, tag_value):
             if tag_key in tags and tags[tag_key] == tag_value:
                 tagged_functions.append(function)
         except Exception as e:
-            logger.warning(f'Error getting tags for function {function["FunctionName"]}: {e}')
+            logger.warning('Error getting tags for function %s: %s', function['FunctionName'], e)
 
-    logger.info(f'{len(tagged_functions)} Lambda functions found with tag {tag_key}={tag_value}.')
+    logger.info(
+        '%d Lambda functions found with tag %s=%s.', len(tagged_functions), tag_key, tag_value
+    )
     return tagged_functions
 
 
@@ -255,18 +270,19 @@ def register_lambda_functions():
     """Register Lambda functions as individual tools."""
     try:
         logger.info('Registering Lambda functions as individual tools...')
-        functions = lambda_client.list_functions()
-
-        # Get all functions
-        all_functions = functions['Functions']
-        logger.info(f'Total Lambda functions found: {len(all_functions)}')
+        # list_functions returns at most 50 functions per call, so walk every page
+        paginator = lambda_client.get_paginator('list_functions')
+        all_functions = [
+            function for page in paginator.paginate() for function in page['Functions']
+        ]
+        logger.info('Total Lambda functions found: %d', len(all_functions))
 
         # First filter by function name if prefix or list is set
         if FUNCTION_PREFIX or FUNCTION_LIST:
             valid_functions = [
                 f for f in all_functions if validate_function_name(f['FunctionName'])
             ]
-            logger.info(f'{len(valid_functions)} Lambda functions found after name filtering.')
+            logger.info('%d Lambda functions found after name filtering.', len(valid_functions))
         else:
             valid_functions = all_functions
             logger.info(
@@ -295,7 +311,7 @@ def register_lambda_functions():
         logger.info('Lambda functions registered successfully as individual tools.')
 
     except Exception as e:
-        logger.error(f'Error registering Lambda functions as tools: {e}')
+        logger.error('Error registering Lambda functions as tools: %s', e)
 
 
 def main():
@@ -1,8 +1,15 @@
 """Test fixtures for the lambda-mcp-server tests."""
 
+import io
 import json
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+
+SUCCESS_PAYLOAD = json.dumps({'result': 'success'}).encode()
+NON_JSON_PAYLOAD = b'Non-JSON response'
+ERROR_PAYLOAD = json.dumps({'error': 'Function error'}).encode()
+EMPTY_PAYLOAD = json.dumps({}).encode()
 
 
 @pytest.fixture
@@ -10,31 +17,37 @@ def mock_lambda_client():
     """Create a mock boto3 Lambda client."""
     mock_client = MagicMock()
 
-    # Mock list_functions response
-    mock_client.list_functions.return_value = {
-        'Functions': [
-            {
-                'FunctionName': 'test-function-1',
-                'FunctionArn': 'arn:aws:lambda:us-east-1:123456789012:function:test-function-1',
-                'Description': 'Test function 1 description',
-            },
-            {
-                'FunctionName': 'test-function-2',
-                'FunctionArn': 'arn:aws:lambda:us-east-1:123456789012:function:test-function-2',
-                'Description': 'Test function 2 description',
-            },
-            {
-                'FunctionName': 'prefix-test-function-3',
-                'FunctionArn': 'arn:aws:lambda:us-east-1:123456789012:function:prefix-test-function-3',
-                'Description': 'Test function 3 with prefix',
-            },
-            {
-                'FunctionName': 'other-function',
-                'FunctionArn': 'arn:aws:lambda:us-east-1:123456789012:function:other-function',
-                'Description': '',  # Empty description
-            },
-        ]
-    }
+    # Mock the list_functions paginator; the functions are split over two pages
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            'Functions': [
+                {
+                    'FunctionName': 'test-function-1',
+                    'FunctionArn': 'arn:aws:lambda:us-east-1:123456789012:function:test-function-1',
+                    'Description': 'Test function 1 description',
+                },
+                {
+                    'FunctionName': 'test-function-2',
+                    'FunctionArn': 'arn:aws:lambda:us-east-1:123456789012:function:test-function-2',
+                    'Description': 'Test function 2 description',
+                },
+            ]
+        },
+        {
+            'Functions': [
+                {
+                    'FunctionName': 'prefix-test-function-3',
+                    'FunctionArn': 'arn:aws:lambda:us-east-1:123456789012:function:prefix-test-function-3',
+                    'Description': 'Test function 3 with prefix',
+                },
+                {
+                    'FunctionName': 'other-function',
+                    'FunctionArn': 'arn:aws:lambda:us-east-1:123456789012:function:other-function',
+                    'Description': '',  # Empty description
+                },
+            ]
+        },
+    ]
 
     # Mock list_tags response
     def mock_list_tags(Resource):
@@ -49,33 +62,29 @@ def mock_lambda_client():
 
     mock_client.list_tags.side_effect = mock_list_tags
 
-    # Mock invoke response
+    # Mock invoke response; BytesIO stands in for botocore's StreamingBody payload
     def mock_invoke(FunctionName, InvocationType, Payload):
         if FunctionName == 'test-function-1':
-            mock_payload = MagicMock()
-            mock_payload.read.return_value = json.dumps({'result': 'success'}).encode()
+            mock_payload = io.BytesIO(SUCCESS_PAYLOAD)
             return {
                 'StatusCode': 200,
                 'Payload': mock_payload,
             }
         elif FunctionName == 'test-function-2':
-            mock_payload = MagicMock()
-            mock_payload.read.return_value = b'Non-JSON response'
+            mock_payload = io.BytesIO(NON_JSON_PAYLOAD)
             return {
                 'StatusCode': 200,
                 'Payload': mock_payload,
             }
         elif FunctionName == 'error-function':
-            mock_payload = MagicMock()
-            mock_payload.read.return_value = json.dumps({'error': 'Function error'}).encode()
+            mock_payload = io.BytesIO(ERROR_PAYLOAD)
             return {
                 'StatusCode': 200,
                 'FunctionError': 'Handled',
                 'Payload': mock_payload,
             }
         else:
-            mock_payload = MagicMock()
-            mock_payload.read.return_value = json.dumps({}).encode()
+            mock_payload = io.BytesIO(EMPTY_PAYLOAD)
             return {
                 'StatusCode': 200,
                 'Payload': mock_payload,
@@ -84,3 +93,17 @@ def mock_lambda_client():
     mock_client.invoke.side_effect = mock_invoke
 
     return mock_client
+
+
+@pytest.fixture
+def patched_lambda_client(mock_lambda_client):
+    """Install the mock Lambda client as the server's module-level client."""
+    with patch('awslabs.lambda_mcp_server.server.lambda_client', mock_lambda_client):
+        yield mock_lambda_client
+
+
+@pytest.fixture
+def mock_schemas_client():
+    """Replace the server's EventBridge Schemas client with a mock."""
+    with patch('awslabs.lambda_mcp_server.server.schemas_client') as mock_client:
+        yield mock_client
@@ -13,42 +13,29 @@ with pytest.MonkeyPatch().context() as CTX:
 class TestRegisterLambdaFunctionsSpecific:
     """Tests specifically for the register_lambda_functions function."""
 
-    @patch('awslabs.lambda_mcp_server.server.FUNCTION_TAG_KEY', 'test-key')
-    @patch('awslabs.lambda_mcp_server.server.FUNCTION_TAG_VALUE', '')
+    @pytest.mark.parametrize(
+        'tag_key,tag_value',
+        [('test-key', ''), ('', 'test-value')],
+        ids=['only_tag_key', 'only_tag_value'],
+    )
     @patch('awslabs.lambda_mcp_server.server.create_lambda_tool')
-    def test_register_with_only_tag_key(self, mock_create_lambda_tool, mock_lambda_client, caplog):
-        """Test registering Lambda functions with only tag key set."""
-        with patch('awslabs.lambda_mcp_server.server.lambda_client', mock_lambda_client):
-            with caplog.at_level(logging.WARNING):
-                # Call the function
-                register_lambda_functions()
-
-                # Should not register any functions
-                assert mock_create_lambda_tool.call_count == 0
-
-                # Should log a warning - this specifically targets line 229
-                assert (
-                    'Both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE must be set to filter by tag'
-                    in caplog.text
-                )
-
-    @patch('awslabs.lambda_mcp_server.server.FUNCTION_TAG_KEY', '')
-    @patch('awslabs.lambda_mcp_server.server.FUNCTION_TAG_VALUE', 'test-value')
-    @patch('awslabs.lambda_mcp_server.server.create_lambda_tool')
-    def test_register_with_only_tag_value(
-        self, mock_create_lambda_tool, mock_lambda_client, caplog
+    def test_register_with_incomplete_tag_filter(
+        self, mock_create_lambda_tool, patched_lambda_client, tag_key, tag_value, caplog
     ):
-        """Test registering Lambda functions with only tag value set."""
-        with patch('awslabs.lambda_mcp_server.server.lambda_client', mock_lambda_client):
-            with caplog.at_level(logging.WARNING):
-                # Call the function
-                register_lambda_functions()
-
-                # Should not register any functions
-                assert mock_create_lambda_tool.call_count == 0
-
-                # Should log a warning - this specifically targets line 229
-                assert (
-                    'Both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE must be set to filter by tag'
-                    in caplog.text
-                )
+        """Test registering Lambda functions with only one of tag key and tag value set."""
+        with (
+            patch('awslabs.lambda_mcp_server.server.FUNCTION_TAG_KEY', tag_key),
+            patch('awslabs.lambda_mcp_server.server.FUNCTION_TAG_VALUE', tag_value),
+            caplog.at_level(logging.WARNING),
+        ):
+            # Call the function
+            register_lambda_functions()
+
+            # Should not register any functions
+            assert mock_create_lambda_tool.call_count == 0
+
+            # Should log a warning - this specifically targets line 229
+            assert (
+                'Both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE must be set to filter by tag'
+                in caplog.text
+            )
@@ -17,80 +17,76 @@ with pytest.MonkeyPatch().context() as CTX:
 class TestSchemaRegistry:
     """Tests for EventBridge Schema Registry integration."""
 
-    def test_get_schema_valid_arn(self, caplog):
+    def test_get_schema_valid_arn(self, mock_schemas_client, caplog):
         """Test fetching schema with valid ARN."""
         mock_schema_content = {'type': 'object', 'properties': {'test': {'type': 'string'}}}
 
-        with patch('awslabs.lambda_mcp_server.server.schemas_client') as mock_client:
-            # Set up the mock
-            mock_client.describe_schema.return_value = {'Content': mock_schema_content}
+        # Set up the mock
+        mock_schemas_client.describe_schema.return_value = {'Content': mock_schema_content}
 
-            # Call the function with a valid ARN
-            result = get_schema_from_registry(
-                'arn:aws:schemas:us-east-1:123456789012:schema/registry-name/schema-name'
-            )
+        # Call the function with a valid ARN
+        result = get_schema_from_registry(
+            'arn:aws:schemas:us-east-1:123456789012:schema/registry-name/schema-name'
+        )
 
-            # Verify the result
-            assert result == mock_schema_content
+        # Verify the result
+        assert result == mock_schema_content
 
-            # Verify the client was called with correct parameters
-            mock_client.describe_schema.assert_called_once_with(
-                RegistryName='registry-name',
-                SchemaName='schema-name',
-            )
+        # Verify the client was called with correct parameters
+        mock_schemas_client.describe_schema.assert_called_once_with(
+            RegistryName='registry-name',
+            SchemaName='schema-name',
+        )
 
-    def test_get_schema_invalid_arn_format(self, caplog):
+    def test_get_schema_invalid_arn_format(self, mock_schemas_client, caplog):
         """Test with invalid ARN format."""
-        with patch('awslabs.lambda_mcp_server.server.schemas_client') as mock_client:
-            with caplog.at_level(logging.ERROR):
-                # Test with invalid ARN
-                result = get_schema_from_registry('invalid:arn:format')
+        with caplog.at_level(logging.ERROR):
+            # Test with invalid ARN
+            result = get_schema_from_registry('invalid:arn:format')
 
-                # Verify the result is None
-                assert result is None
+            # Verify the result is None
+            assert result is None
 
-                # Verify error was logged
-                assert 'Invalid schema ARN format' in caplog.text
+            # Verify error was logged
+            assert 'Invalid schema ARN format' in caplog.text
 
-                # Verify client was not called
-                mock_client.describe_schema.assert_not_called()
+            # Verify client was not called
+            mock_schemas_client.describe_schema.assert_not_called()
 
-    def test_get_schema_invalid_path(self, caplog):
+    def test_get_schema_invalid_path(self, mock_schemas_client, caplog):
         """Test with invalid schema path in ARN."""
-        with patch('awslabs.lambda_mcp_server.server.schemas_client') as mock_client:
-            with caplog.at_level(logging.ERROR):
-                # Test with ARN containing invalid path
-                result = get_schema_from_registry(
-                    'arn:aws:schemas:us-east-1:123456789012:schema/invalid-path'
-                )
+        with caplog.at_level(logging.ERROR):
+            # Test with ARN containing invalid path
+            result = get_schema_from_registry(
+                'arn:aws:schemas:us-east-1:123456789012:schema/invalid-path'
+            )
 
-                # Verify the result is None
-                assert result is None
+            # Verify the result is None
+            assert result is None
 
-                # Verify error was logged
-                assert 'Invalid schema path in ARN' in caplog.text
+            # Verify error was logged
+            assert 'Invalid schema path in ARN' in caplog.text
 
-                # Verify client was not called
-                mock_client.describe_schema.assert_not_called()
+            # Verify client was not called
+            mock_schemas_client.describe_schema.assert_not_called()
 
-    def test_get_schema_client_error(self, caplog):
+    def test_get_schema_client_error(self, mock_schemas_client, caplog):
         """Test handling of schema client errors."""
-        with patch('awslabs.lambda_mcp_server.server.schemas_client') as mock_client:
-            # Set up the mock to raise an exception
-            mock_client.describe_schema.side_effect = Exception('Schema client error')
+        # Set up the mock to raise an exception
+        mock_schemas_client.describe_schema.side_effect = Exception('Schema client error')
 
-            with caplog.at_level(logging.ERROR):
-                # Call the function
-                result = get_schema_from_registry(
-                    'arn:aws:schemas:us-east-1:123456789012:schema/registry-name/schema-name'
-                )
+        with caplog.at_level(logging.ERROR):
+            # Call the function
+            result = get_schema_from_registry(
+                'arn:aws:schemas:us-east-1:123456789012:schema/registry-name/schema-name'
+            )
 
-                # Verify the result is None
-                assert result is None
+            # Verify the result is None
+            assert result is None
 
-                # Verify error was logged
-                assert 'Error fetching schema from registry' in caplog.text
-                assert 'Schema client error' in caplog.text
+            # Verify error was logged
+            assert 'Error fetching schema from registry' in caplog.text
+            assert 'Schema client error' in caplog.text
 
 
 class TestSchemaArnRetrieval:
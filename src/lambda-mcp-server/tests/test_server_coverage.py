@@ -88,43 +88,41 @@ class TestRegisterLambdaFunctionsCoverage:
     @patch('awslabs.lambda_mcp_server.server.FUNCTION_TAG_VALUE', '')
     @patch('awslabs.lambda_mcp_server.server.create_lambda_tool')
     def test_register_with_incomplete_tag_config(
-        self, mock_create_lambda_tool, mock_lambda_client, caplog
+        self, mock_create_lambda_tool, patched_lambda_client, caplog
     ):
         """Test registering Lambda functions with incomplete tag configuration."""
-        with patch('awslabs.lambda_mcp_server.server.lambda_client', mock_lambda_client):
-            with caplog.at_level(logging.WARNING):
-                # Call the function
-                register_lambda_functions()
+        with caplog.at_level(logging.WARNING):
+            # Call the function
+            register_lambda_functions()
 
-                # Should not register any functions
-                assert mock_create_lambda_tool.call_count == 0
+            # Should not register any functions
+            assert mock_create_lambda_tool.call_count == 0
 
-                # Should log a warning
-                assert (
-                    'Both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE must be set to filter by tag'
-                    in caplog.text
-                )
+            # Should log a warning
+            assert (
+                'Both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE must be set to filter by tag'
+                in caplog.text
+            )
 
     @patch('awslabs.lambda_mcp_server.server.FUNCTION_TAG_KEY', '')
     @patch('awslabs.lambda_mcp_server.server.FUNCTION_TAG_VALUE', 'test-value')
     @patch('awslabs.lambda_mcp_server.server.create_lambda_tool')
     def test_register_with_incomplete_tag_config_reversed(
-        self, mock_create_lambda_tool, mock_lambda_client, caplog
+        self, mock_create_lambda_tool, patched_lambda_client, caplog
     ):
         """Test registering Lambda functions with incomplete tag configuration (reversed case)."""
-        with patch('awslabs.lambda_mcp_server.server.lambda_client', mock_lambda_client):
-            with caplog.at_level(logging.WARNING):
-                # Call the function
-                register_lambda_functions()
+        with caplog.at_level(logging.WARNING):
+            # Call the function
+            register_lambda_functions()
 
-                # Should not register any functions
-                assert mock_create_lambda_tool.call_count == 0
+            # Should not register any functions
+            assert mock_create_lambda_tool.call_count == 0
 
-                # Should log a warning
-                assert (
-                    'Both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE must be set to filter by tag'
-                    in caplog.text
-                )
+            # Should log a warning
+            assert (
+                'Both FUNCTION_TAG_KEY and FUNCTION_TAG_VALUE must be set to filter by tag'
+                in caplog.text
+            )
 
 
 class TestValidateFunctionNameCoverage:
@@ -137,15 +135,13 @@ class TestValidateFunctionNameCoverage:
 
         # With prefix set
         with patch('awslabs.lambda_mcp_server.server.FUNCTION_PREFIX', 'test-'):
-            assert validate_function_name('') is False
-            assert validate_function_name('test-') is True
-            assert validate_function_name('test') is False
+            names = ('', 'test-', 'test')
+            assert [validate_function_name(name) for name in names] == [False, True, False]
 
         # With list set
         with patch('awslabs.lambda_mcp_server.server.FUNCTION_LIST', ['func1', 'func2']):
-            assert validate_function_name('') is False
-            assert validate_function_name('func1') is True
-            assert validate_function_name('func3') is False
+            names = ('', 'func1', 'func3')
+            assert [validate_function_name(name) for name in names] == [False, True, False]
 
 
 class TestSanitizeToolNameCoverage:
@@ -13,16 +13,21 @@
 import base64
 import json
 import pytest
-import tempfile
-from typing import Dict, Generator, List
+from pathlib import Path
+from typing import Dict, List
 from unittest.mock import AsyncMock, MagicMock
 
 
+MOCK_BASE64_IMAGES = (
+    base64.b64encode(b'mock_image_data_1').decode('utf-8'),
+    base64.b64encode(b'mock_image_data_2').decode('utf-8'),
+)
+
+
 @pytest.fixture
-def temp_workspace_dir() -> Generator[str, None, None]:
+def temp_workspace_dir(tmp_path: Path) -> str:
     """Create a temporary directory for image output."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -33,12 +38,7 @@ def mock_bedrock_runtime_client() -> MagicMock:
     # Mock the invoke_model method
     mock_response = {'body': MagicMock()}
     mock_response['body'].read.return_value = json.dumps(
-        {
-            'images': [
-                base64.b64encode(b'mock_image_data_1').decode('utf-8'),
-                base64.b64encode(b'mock_image_data_2').decode('utf-8'),
-            ]
-        }
+        {'images': list(MOCK_BASE64_IMAGES)}
     ).encode('utf-8')
 
     mock_client.invoke_model.return_value = mock_response
@@ -66,21 +66,13 @@ def sample_colors() -> List[str]:
 @pytest.fixture
 def sample_base64_images() -> List[str]:
     """Return a list of sample base64-encoded images for testing."""
-    return [
-        base64.b64encode(b'mock_image_data_1').decode('utf-8'),
-        base64.b64encode(b'mock_image_data_2').decode('utf-8'),
-    ]
+    return list(MOCK_BASE64_IMAGES)
 
 
 @pytest.fixture
 def mock_successful_response() -> Dict:
     """Return a mock successful response from the Nova Canvas API."""
-    return {
-        'images': [
-            base64.b64encode(b'mock_image_data_1').decode('utf-8'),
-            base64.b64encode(b'mock_image_data_2').decode('utf-8'),
-        ]
-    }
+    return {'images': list(MOCK_BASE64_IMAGES)}
 
 
 @pytest.fixture
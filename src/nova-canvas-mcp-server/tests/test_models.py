@@ -25,6 +25,27 @@ from awslabs.nova_canvas_mcp_server.models import (
 from pydantic import ValidationError
 
 
+SUCCESS_RESPONSE_FIELDS = {
+    'status': 'success',
+    'message': 'Generated 2 image(s)',
+    'paths': ['/path/to/image1.png', '/path/to/image2.png'],
+    'prompt': 'A beautiful mountain landscape',
+}
+
+
+@pytest.fixture(scope='module')
+def custom_config() -> ImageGenerationConfig:
+    """Return a fully customized ImageGenerationConfig shared by the tests in this module."""
+    return ImageGenerationConfig(
+        width=512,
+        height=768,
+        quality=Quality.PREMIUM,
+        cfgScale=8.0,
+        seed=12345,
+        numberOfImages=3,
+    )
+
+
 class TestEnums:
     """Tests for the enum classes."""
 
@@ -52,22 +73,20 @@ class TestImageGenerationConfig:
         assert 0 <= config.seed <= 858993459
         assert config.numberOfImages == 1
 
-    def test_custom_values(self):
+    @pytest.mark.parametrize(
+        'field,expected',
+        [
+            ('width', 512),
+            ('height', 768),
+            ('quality', Quality.PREMIUM),
+            ('cfgScale', 8.0),
+            ('seed', 12345),
+            ('numberOfImages', 3),
+        ],
+    )
+    def test_custom_values(self, custom_config, field, expected):
         """Test that custom values are accepted."""
-        config = ImageGenerationConfig(
-            width=512,
-            height=768,
-            quality=Quality.PREMIUM,
-            cfgScale=8.0,
-            seed=12345,
-            numberOfImages=3,
-        )
-        assert config.width == 512
-        assert config.height == 768
-        assert config.quality == Quality.PREMIUM
-        assert config.cfgScale == 8.0
-        assert config.seed == 12345
-        assert config.numberOfImages == 3
+        assert getattr(custom_config, field) == expected
 
     def test_width_height_divisible_by_16(self):
         """Test that width and height must be divisible by 16."""
@@ -280,20 +299,13 @@ class TestTextImageRequest:
         assert request.textToImageParams.negativeText is None
         assert isinstance(request.imageGenerationConfig, ImageGenerationConfig)
 
-    def test_custom_values(self):
+    def test_custom_values(self, custom_config):
         """Test that custom values are accepted."""
         request = TextImageRequest(
             textToImageParams=TextToImageParams(
                 text='A beautiful mountain landscape', negativeText='people, clouds'
             ),
-            imageGenerationConfig=ImageGenerationConfig(
-                width=512,
-                height=768,
-                quality=Quality.PREMIUM,
-                cfgScale=8.0,
-                seed=12345,
-                numberOfImages=3,
-            ),
+            imageGenerationConfig=custom_config,
         )
         assert request.taskType == TaskType.TEXT_IMAGE
         assert request.textToImageParams.text == 'A beautiful mountain landscape'
@@ -353,7 +365,7 @@ class TestColorGuidedRequest:
         assert request.colorGuidedGenerationParams.negativeText is None
         assert isinstance(request.imageGenerationConfig, ImageGenerationConfig)
 
-    def test_custom_values(self):
+    def test_custom_values(self, custom_config):
         """Test that custom values are accepted."""
         request = ColorGuidedRequest(
             colorGuidedGenerationParams=ColorGuidedGenerationParams(
@@ -361,14 +373,7 @@ class TestColorGuidedRequest:
                 colors=['#FF5733', '#33FF57', '#3357FF'],
                 negativeText='people, clouds',
             ),
-            imageGenerationConfig=ImageGenerationConfig(
-                width=512,
-                height=768,
-                quality=Quality.PREMIUM,
-                cfgScale=8.0,
-                seed=12345,
-                numberOfImages=3,
-            ),
+            imageGenerationConfig=custom_config,
         )
         assert request.taskType == TaskType.COLOR_GUIDED_GENERATION
         assert request.colorGuidedGenerationParams.text == 'A beautiful mountain landscape'
@@ -437,26 +442,23 @@ class TestMcpImageGenerationResponse:
 
 
 class TestImageGenerationResponse:
-    """Tests for the ImageGenerationResponse model."""
+    """Tests for the ImageGenerationResponse model.
+
+    ImageGenerationResponse has no validators, so only test_success_response goes through
+    validation; the rest use model_construct, which skips it and is only safe on trusted data.
+    """
 
     def test_success_response(self):
         """Test that a success response is created correctly."""
-        response = ImageGenerationResponse(
-            status='success',
-            message='Generated 2 image(s)',
-            paths=['/path/to/image1.png', '/path/to/image2.png'],
-            prompt='A beautiful mountain landscape',
-        )
-        assert response.status == 'success'
-        assert response.message == 'Generated 2 image(s)'
-        assert response.paths == ['/path/to/image1.png', '/path/to/image2.png']
-        assert response.prompt == 'A beautiful mountain landscape'
+        response = ImageGenerationResponse(**SUCCESS_RESPONSE_FIELDS)
+        for field, value in SUCCESS_RESPONSE_FIELDS.items():
+            assert getattr(response, field) == value
         assert response.negative_prompt is None
         assert response.colors is None
 
     def test_error_response(self):
         """Test that an error response is created correctly."""
-        response = ImageGenerationResponse(
+        response = ImageGenerationResponse.model_construct(
             status='error',
             message='An error occurred during image generation',
             paths=[],
@@ -471,33 +473,21 @@ class TestImageGenerationResponse:
 
     def test_with_optional_fields(self):
         """Test with optional fields."""
-        response = ImageGenerationResponse(
-            status='success',
-            message='Generated 2 image(s)',
-            paths=['/path/to/image1.png', '/path/to/image2.png'],
-            prompt='A beautiful mountain landscape',
+        response = ImageGenerationResponse.model_construct(
+            **SUCCESS_RESPONSE_FIELDS,
             negative_prompt='people, clouds',
             colors=['#FF5733', '#33FF57', '#3357FF'],
         )
-        assert response.status == 'success'
-        assert response.message == 'Generated 2 image(s)'
-        assert response.paths == ['/path/to/image1.png', '/path/to/image2.png']
-        assert response.prompt == 'A beautiful mountain landscape'
+        for field, value in SUCCESS_RESPONSE_FIELDS.items():
+            assert getattr(response, field) == value
         assert response.negative_prompt == 'people, clouds'
         assert response.colors == ['#FF5733', '#33FF57', '#3357FF']
 
     def test_dictionary_access(self):
         """Test dictionary-style access."""
-        response = ImageGenerationResponse(
-            status='success',
-            message='Generated 2 image(s)',
-            paths=['/path/to/image1.png', '/path/to/image2.png'],
-            prompt='A beautiful mountain landscape',
-        )
-        assert response['status'] == 'success'
-        assert response['message'] == 'Generated 2 image(s)'
-        assert response['paths'] == ['/path/to/image1.png', '/path/to/image2.png']
-        assert response['prompt'] == 'A beautiful mountain landscape'
+        response = ImageGenerationResponse.model_construct(**SUCCESS_RESPONSE_FIELDS)
+        for field, value in SUCCESS_RESPONSE_FIELDS.items():
+            assert response[field] == value
 
         # Test accessing non-existent key
         with pytest.raises(KeyError):
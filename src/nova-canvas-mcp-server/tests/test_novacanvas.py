@@ -29,6 +29,7 @@ from awslabs.nova_canvas_mcp_server.novacanvas import (
     invoke_nova_canvas,
     save_generated_images,
 )
+from pathlib import Path
 from unittest.mock import patch
 
 
@@ -46,15 +47,12 @@ class TestSaveGeneratedImages:
 
         # Check that the paths are returned correctly
         assert len(result['paths']) == 2
-        assert all(os.path.exists(path) for path in result['paths'])
         assert all(os.path.basename(path).startswith('test_image_') for path in result['paths'])
         assert all(path.endswith('.png') for path in result['paths'])
 
         # Check that the images were saved with the correct content
         for i, path in enumerate(result['paths']):
-            with open(path, 'rb') as f:
-                content = f.read()
-                assert content == b'mock_image_data_' + str(i + 1).encode()
+            assert Path(path).read_bytes() == b'mock_image_data_' + str(i + 1).encode()
 
     def test_save_images_without_filename(self, temp_workspace_dir, sample_base64_images):
         """Test saving images without a specified filename."""
@@ -67,15 +65,12 @@ class TestSaveGeneratedImages:
 
         # Check that the paths are returned correctly
         assert len(result['paths']) == 2
-        assert all(os.path.exists(path) for path in result['paths'])
         assert all(os.path.basename(path).startswith('nova_canvas_') for path in result['paths'])
         assert all(path.endswith('.png') for path in result['paths'])
 
         # Check that the images were saved with the correct content
         for i, path in enumerate(result['paths']):
-            with open(path, 'rb') as f:
-                content = f.read()
-                assert content == b'mock_image_data_' + str(i + 1).encode()
+            assert Path(path).read_bytes() == b'mock_image_data_' + str(i + 1).encode()
 
     def test_save_single_image(self, temp_workspace_dir):
         """Test saving a single image."""
@@ -90,13 +85,10 @@ class TestSaveGeneratedImages:
 
         # Check that the path is returned correctly
         assert len(result['paths']) == 1
-        assert os.path.exists(result['paths'][0])
         assert os.path.basename(result['paths'][0]) == 'single_image.png'
 
         # Check that the image was saved with the correct content
-        with open(result['paths'][0], 'rb') as f:
-            content = f.read()
-            assert content == b'mock_single_image_data'
+        assert Path(result['paths'][0]).read_bytes() == b'mock_single_image_data'
 
     def test_save_images_creates_output_dir(self, temp_workspace_dir, sample_base64_images):
         """Test that the output directory is created if it doesn't exist."""
@@ -111,14 +103,11 @@ class TestSaveGeneratedImages:
             workspace_dir=nested_dir,
         )
 
-        # Check that the output directory was created
+        # Check that the image was saved in the created output directory
         output_dir = os.path.join(nested_dir, DEFAULT_OUTPUT_DIR)
-        assert os.path.exists(output_dir)
-
-        # Check that the image was saved in the correct location
         assert len(result['paths']) == 1
-        assert os.path.exists(result['paths'][0])
         assert os.path.dirname(result['paths'][0]) == os.path.abspath(output_dir)
+        assert os.path.isfile(result['paths'][0])
 
 
 class TestInvokeNovaCanvas:
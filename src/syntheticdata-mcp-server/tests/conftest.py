@@ -4,22 +4,21 @@ import boto3
 import os
 import pytest
 import sys
-import tempfile
 from .test_constants import TEST_AWS_CONFIG, TEST_AWS_CREDENTIALS
 from botocore.client import BaseClient
 from moto import mock_aws
+from pathlib import Path
 from typing import Dict, Generator, List
 
 
 @pytest.fixture
-def temp_dir() -> Generator[str, None, None]:
+def temp_dir(tmp_path: Path) -> str:
     """Create a temporary directory for test files.
 
-    Yields:
+    Returns:
         Path to temporary directory
     """
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield tmp_dir
+    return str(tmp_path)
 
 
 @pytest.fixture
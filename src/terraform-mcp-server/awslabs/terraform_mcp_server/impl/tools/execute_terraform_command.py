@@ -1,10 +1,13 @@
 """Implementation of Terraform command execution tool."""
 
+import asyncio
 import json
 import os
-import re
 import subprocess
-from awslabs.terraform_mcp_server.impl.tools.utils import get_dangerous_patterns
+from awslabs.terraform_mcp_server.impl.tools.utils import (
+    clean_output_text,
+    get_dangerous_patterns,
+)
 from awslabs.terraform_mcp_server.models import TerraformExecutionRequest, TerraformExecutionResult
 from loguru import logger
 
@@ -25,62 +28,6 @@ async def execute_terraform_command_impl(
     """
     logger.info(f"Executing 'terraform {request.command}' in {request.working_directory}")
 
-    # Helper function to clean output text
-    def clean_output_text(text: str) -> str:
-        """Clean output text by removing or replacing problematic Unicode characters.
-
-        Args:
-            text: The text to clean
-
-        Returns:
-            Cleaned text with ASCII-friendly replacements
-        """
-        if not text:
-            return text
-
-        # First remove ANSI escape sequences (color codes, cursor movement)
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        text = ansi_escape.sub('', text)
-
-        # Remove C0 and C1 control characters (except common whitespace)
-        control_chars = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]')
-        text = control_chars.sub('', text)
-
-        # Replace HTML entities
-        html_entities = {
-            '-&gt;': '->',  # Replace HTML arrow
-            '&lt;': '<',  # Less than
-            '&gt;': '>',  # Greater than
-            '&amp;': '&',  # Ampersand
-        }
-        for entity, replacement in html_entities.items():
-            text = text.replace(entity, replacement)
-
-        # Replace box-drawing and other special Unicode characters with ASCII equivalents
-        unicode_chars = {
-            '\u2500': '-',  # Horizontal line
-            '\u2502': '|',  # Vertical line
-            '\u2514': '+',  # Up and right
-            '\u2518': '+',  # Up and left
-            '\u2551': '|',  # Double vertical
-            '\u2550': '-',  # Double horizontal
-            '\u2554': '+',  # Double down and right
-            '\u2557': '+',  # Double down and left
-            '\u255a': '+',  # Double up and right
-            '\u255d': '+',  # Double up and left
-            '\u256c': '+',  # Double cross
-            '\u2588': '#',  # Full block
-            '\u25cf': '*',  # Black circle
-            '\u2574': '-',  # Left box drawing
-            '\u2576': '-',  # Right box drawing
-            '\u2577': '|',  # Down box drawing
-            '\u2575': '|',  # Up box drawing
-        }
-        for char, replacement in unicode_chars.items():
-            text = text.replace(char, replacement)
-
-        return text
-
     # Set environment variables for AWS region if provided
     env = os.environ.copy()
     if request.aws_region:
@@ -134,8 +81,18 @@ async def execute_terraform_command_impl(
 
     # Execute command
     try:
-        process = subprocess.run(
-            cmd, cwd=request.working_directory, capture_output=True, text=True, env=env
+        # Terraform runs can take minutes, so wait for them in a worker thread instead of
+        # blocking the event loop (and every other tool call) until the command exits. stdin is
+        # closed because the server's own stdin carries the MCP stdio transport; an interactive
+        # prompt must fail fast rather than read protocol bytes or hang
+        process = await asyncio.to_thread(
+            subprocess.run,
+            cmd,
+            cwd=request.working_directory,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            env=env,
         )
 
         # Prepare the result
@@ -162,9 +119,11 @@ async def execute_terraform_command_impl(
         if request.command == 'apply' and process.returncode == 0:
             try:
                 logger.info('Getting Terraform outputs')
-                output_process = subprocess.run(
+                output_process = await asyncio.to_thread(
+                    subprocess.run,
                     ['terraform', 'output', '-json'],
                     cwd=request.working_directory,
+                    stdin=subprocess.DEVNULL,
                     capture_output=True,
                     text=True,
                     env=env,
@@ -1,10 +1,14 @@
 """Implementation of Checkov scan tools."""
 
+import asyncio
 import json
 import os
 import re
 import subprocess
-from awslabs.terraform_mcp_server.impl.tools.utils import get_dangerous_patterns
+from awslabs.terraform_mcp_server.impl.tools.utils import (
+    clean_output_text,
+    get_dangerous_patterns,
+)
 from awslabs.terraform_mcp_server.models import (
     CheckovScanRequest,
     CheckovScanResult,
@@ -14,62 +18,6 @@ from loguru import logger
 from typing import Any, Dict, List, Tuple
 
 
-def _clean_output_text(text: str) -> str:
-    """Clean output text by removing or replacing problematic Unicode characters.
-
-    Args:
-        text: The text to clean
-
-    Returns:
-        Cleaned text with ASCII-friendly replacements
-    """
-    if not text:
-        return text
-
-    # First remove ANSI escape sequences (color codes, cursor movement)
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    text = ansi_escape.sub('', text)
-
-    # Remove C0 and C1 control characters (except common whitespace)
-    control_chars = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]')
-    text = control_chars.sub('', text)
-
-    # Replace HTML entities
-    html_entities = {
-        '-&gt;': '->',  # Replace HTML arrow
-        '&lt;': '<',  # Less than
-        '&gt;': '>',  # Greater than
-        '&amp;': '&',  # Ampersand
-    }
-    for entity, replacement in html_entities.items():
-        text = text.replace(entity, replacement)
-
-    # Replace box-drawing and other special Unicode characters with ASCII equivalents
-    unicode_chars = {
-        '\u2500': '-',  # Horizontal line
-        '\u2502': '|',  # Vertical line
-        '\u2514': '+',  # Up and right
-        '\u2518': '+',  # Up and left
-        '\u2551': '|',  # Double vertical
-        '\u2550': '-',  # Double horizontal
-        '\u2554': '+',  # Double down and right
-        '\u2557': '+',  # Double down and left
-        '\u255a': '+',  # Double up and right
-        '\u255d': '+',  # Double up and left
-        '\u256c': '+',  # Double cross
-        '\u2588': '#',  # Full block
-        '\u25cf': '*',  # Black circle
-        '\u2574': '-',  # Left box drawing
-        '\u2576': '-',  # Right box drawing
-        '\u2577': '|',  # Down box drawing
-        '\u2575': '|',  # Up box drawing
-    }
-    for char, replacement in unicode_chars.items():
-        text = text.replace(char, replacement)
-
-    return text
-
-
 def _ensure_checkov_installed() -> bool:
     """Ensure Checkov is installed, and install it if not.
 
@@ -80,6 +28,7 @@ def _ensure_checkov_installed() -> bool:
         # Check if Checkov is already installed
         subprocess.run(
             ['checkov', '--version'],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             check=False,
@@ -92,6 +41,7 @@ def _ensure_checkov_installed() -> bool:
             # Install Checkov using pip
             subprocess.run(
                 ['pip', 'install', 'checkov'],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 check=True,
@@ -161,18 +111,7 @@ async def run_checkov_scan_impl(request: CheckovScanRequest) -> CheckovScanResul
     """
     logger.info(f'Running Checkov scan in {request.working_directory}')
 
-    # Ensure Checkov is installed
-    if not _ensure_checkov_installed():
-        return CheckovScanResult(
-            status='error',
-            working_directory=request.working_directory,
-            error_message='Failed to install Checkov. Please install it manually with: pip install checkov',
-            vulnerabilities=[],
-            summary={},
-            raw_output=None,
-        )
-
-    # Security checks for parameters
+    # Security checks for parameters, done before the (possibly slow) Checkov install check
 
     # Check framework parameter for allowed values
     allowed_frameworks = ['terraform', 'cloudformation', 'kubernetes', 'dockerfile', 'arm', 'all']
@@ -247,6 +186,17 @@ async def run_checkov_scan_impl(request: CheckovScanRequest) -> CheckovScanResul
                         raw_output=None,
                     )
 
+    # Ensure Checkov is installed
+    if not await asyncio.to_thread(_ensure_checkov_installed):
+        return CheckovScanResult(
+            status='error',
+            working_directory=request.working_directory,
+            error_message='Failed to install Checkov. Please install it manually with: pip install checkov',
+            vulnerabilities=[],
+            summary={},
+            raw_output=None,
+        )
+
     # Build the command
     # Convert working_directory to absolute path if it's not already
     working_dir = request.working_directory
@@ -261,17 +211,15 @@ async def run_checkov_scan_impl(request: CheckovScanRequest) -> CheckovScanResul
     logger.info(f'Using absolute working directory: {working_dir}')
     cmd = ['checkov', '--quiet', '-d', working_dir]
 
-    # Add framework if specified
-    if request.framework:
-        cmd.extend(['--framework', request.framework])
-
-    # Add specific check IDs if provided
-    if request.check_ids:
-        cmd.extend(['--check', ','.join(request.check_ids)])
-
-    # Add skip check IDs if provided
-    if request.skip_check_ids:
-        cmd.extend(['--skip-check', ','.join(request.skip_check_ids)])
+    # Add the optional flags (framework, check IDs, skip check IDs) that have a value
+    optional_flags = {
+        '--framework': request.framework,
+        '--check': ','.join(request.check_ids or []),
+        '--skip-check': ','.join(request.skip_check_ids or []),
+    }
+    for flag, value in optional_flags.items():
+        if value:
+            cmd.extend([flag, value])
 
     # Set output format
     cmd.extend(['--output', request.output_format])
@@ -279,15 +227,19 @@ async def run_checkov_scan_impl(request: CheckovScanRequest) -> CheckovScanResul
     # Execute command
     try:
         logger.info(f'Executing command: {" ".join(cmd)}')
-        process = subprocess.run(
+        # Scans can take a while on large configurations, run them in a worker thread so the
+        # event loop stays free
+        process = await asyncio.to_thread(
+            subprocess.run,
             cmd,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
         )
 
         # Clean output text
-        stdout = _clean_output_text(process.stdout)
-        stderr = _clean_output_text(process.stderr)
+        stdout = clean_output_text(process.stdout)
+        stderr = clean_output_text(process.stderr)
 
         # Debug logging
         logger.info(f'Checkov return code: {process.returncode}')
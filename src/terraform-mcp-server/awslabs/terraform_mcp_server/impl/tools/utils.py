@@ -489,6 +489,61 @@ def parse_variables_tf(content: str) -> List[TerraformVariable]:
     return variables
 
 
+# Command output cleanup tables, built once at import instead of on every call
+# ANSI escape sequences (color codes, cursor movement)
+ANSI_ESCAPE_PATTERN = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# C0 and C1 control characters (except common whitespace)
+CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]')
+# HTML entities, in replacement order
+HTML_ENTITY_REPLACEMENTS = (
+    ('-&gt;', '->'),  # Replace HTML arrow
+    ('&lt;', '<'),  # Less than
+    ('&gt;', '>'),  # Greater than
+    ('&amp;', '&'),  # Ampersand
+)
+# Box-drawing and other special Unicode characters with ASCII equivalents
+UNICODE_CHAR_TRANSLATION = str.maketrans(
+    {
+        '\u2500': '-',  # Horizontal line
+        '\u2502': '|',  # Vertical line
+        '\u2514': '+',  # Up and right
+        '\u2518': '+',  # Up and left
+        '\u2551': '|',  # Double vertical
+        '\u2550': '-',  # Double horizontal
+        '\u2554': '+',  # Double down and right
+        '\u2557': '+',  # Double down and left
+        '\u255a': '+',  # Double up and right
+        '\u255d': '+',  # Double up and left
+        '\u256c': '+',  # Double cross
+        '\u2588': '#',  # Full block
+        '\u25cf': '*',  # Black circle
+        '\u2574': '-',  # Left box drawing
+        '\u2576': '-',  # Right box drawing
+        '\u2577': '|',  # Down box drawing
+        '\u2575': '|',  # Up box drawing
+    }
+)
+
+
+def clean_output_text(text: str) -> str:
+    """Clean command output text by removing or replacing problematic Unicode characters.
+
+    Args:
+        text: The text to clean
+
+    Returns:
+        Cleaned text with ASCII-friendly replacements
+    """
+    if not text:
+        return text
+
+    text = ANSI_ESCAPE_PATTERN.sub('', text)
+    text = CONTROL_CHARS_PATTERN.sub('', text)
+    for entity, replacement in HTML_ENTITY_REPLACEMENTS:
+        text = text.replace(entity, replacement)
+    return text.translate(UNICODE_CHAR_TRANSLATION)
+
+
 # Security-related constants and utilities
 # These are used to prevent command injection and other security issues
 
@@ -14,21 +14,14 @@
 import json
 import os
 import pytest
-import tempfile
+from awslabs.terraform_mcp_server.models import CheckovScanRequest
 from unittest.mock import MagicMock, patch
 
 
 @pytest.fixture
-def temp_terraform_dir():
+def temp_terraform_dir(tmp_path):
     """Create a secure temporary directory for Terraform tests."""
-    # Create a secure temporary directory
-    temp_dir = tempfile.mkdtemp(prefix='terraform_test_')
-    yield temp_dir
-    # Clean up the directory after tests
-    if os.path.exists(temp_dir):
-        import shutil
-
-        shutil.rmtree(temp_dir)
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -368,3 +361,15 @@ def mock_aws_ia_modules():
             'submodules': [],
         },
     ]
+
+
+@pytest.fixture
+def checkov_scan_request(temp_terraform_dir):
+    """Create a default Checkov scan request for the temporary Terraform directory."""
+    return CheckovScanRequest(
+        working_directory=temp_terraform_dir,
+        framework='terraform',
+        output_format='json',
+        check_ids=None,
+        skip_check_ids=None,
+    )
@@ -1,7 +1,7 @@
 """Tests for the execute_terraform_command implementation."""
 
 import json
-import pytest
+import subprocess
 from awslabs.terraform_mcp_server.impl.tools.execute_terraform_command import (
     execute_terraform_command_impl,
 )
@@ -9,10 +9,6 @@ from awslabs.terraform_mcp_server.models.models import TerraformExecutionRequest
 from unittest.mock import MagicMock, patch
 
 
-pytestmark = pytest.mark.asyncio
-
-
-@pytest.mark.asyncio
 async def test_clean_output_text_helper(temp_terraform_dir):
     """Test the clean_output_text helper function indirectly."""
     # Create a mock request with all required parameters
@@ -46,7 +42,6 @@ async def test_clean_output_text_helper(temp_terraform_dir):
         assert 'This -> that <tag> & more' in result.stderr
 
 
-@pytest.mark.asyncio
 async def test_execute_terraform_command_with_region(temp_terraform_dir):
     """Test the Terraform command execution with AWS region setting."""
     # Create a mock subprocess.run result
@@ -74,12 +69,14 @@ async def test_execute_terraform_command_with_region(temp_terraform_dir):
         assert 'AWS_REGION' in env_arg
         assert env_arg['AWS_REGION'] == 'us-east-1'
 
+        # Terraform must never read from the server's stdin, which carries the MCP transport
+        assert mock_run.call_args[1]['stdin'] is subprocess.DEVNULL
+
         # Check the result
         assert result.status == 'success'
         assert result.stdout == 'Terraform initialized in us-east-1 region'
 
 
-@pytest.mark.asyncio
 async def test_execute_terraform_command_exception_handling(temp_terraform_dir):
     """Test the Terraform command execution with exception handling."""
     # Create the request with all required parameters
@@ -102,7 +99,6 @@ async def test_execute_terraform_command_exception_handling(temp_terraform_dir):
         assert result.working_directory == temp_terraform_dir
 
 
-@pytest.mark.asyncio
 async def test_execute_terraform_command_output_error_handling(temp_terraform_dir):
     """Test the Terraform command execution with output error handling."""
     # Create mock subprocess.run results for apply and output commands
@@ -136,7 +132,6 @@ async def test_execute_terraform_command_output_error_handling(temp_terraform_di
         assert result.outputs is None
 
 
-@pytest.mark.asyncio
 async def test_execute_terraform_command_output_json_error(temp_terraform_dir):
     """Test the Terraform command execution with JSON parsing error in outputs."""
     # Create mock subprocess.run results for apply and output commands
@@ -175,7 +170,6 @@ async def test_execute_terraform_command_output_json_error(temp_terraform_dir):
         assert result.outputs is None
 
 
-@pytest.mark.asyncio
 async def test_execute_terraform_command_complex_outputs(temp_terraform_dir):
     """Test the Terraform command execution with complex output structures."""
     # Create mock subprocess.run results for apply and output commands
@@ -12,6 +12,7 @@
 """Tests for the models module of the terraform-mcp-server."""
 
 import os
+import pytest
 from awslabs.terraform_mcp_server.models import (
     CheckovScanRequest,
     CheckovScanResult,
@@ -27,39 +28,36 @@ from awslabs.terraform_mcp_server.models import (
 )
 
 
-class TestTerraformExecutionRequest:
-    """Tests for the TerraformExecutionRequest model."""
+# Expected values shared between the model kwargs and the assertions. Pydantic copies
+# container inputs during validation, so the constants are never mutated by the models.
+VARIABLES = {'environment': 'test'}
+OUTPUTS = {'instance_id': 'i-1234567890abcdef0'}
+CHECK_IDS = ['CKV_AWS_1', 'CKV_AWS_2']
+SKIP_CHECK_IDS = ['CKV_AWS_3']
 
-    def test_terraform_execution_request_creation(self, temp_terraform_dir):
-        """Test creating a TerraformExecutionRequest."""
-        request = TerraformExecutionRequest(
-            command='init',
-            working_directory=temp_terraform_dir,
-            variables={'environment': 'test'},
-            aws_region='us-west-2',
-            strip_ansi=True,
-        )
 
-        assert request.command == 'init'
-        assert request.working_directory == temp_terraform_dir
-        assert request.variables == {'environment': 'test'}
-        assert request.aws_region == 'us-west-2'
-        assert request.strip_ansi is True
+class TestTerraformExecutionRequest:
+    """Tests for the TerraformExecutionRequest model."""
 
-    def test_terraform_execution_request_defaults(self, temp_terraform_dir):
-        """Test TerraformExecutionRequest with default values."""
+    @pytest.mark.parametrize(
+        'variables,aws_region',
+        [(VARIABLES, 'us-west-2'), (None, None)],
+        ids=['all_fields', 'defaults'],
+    )
+    def test_terraform_execution_request(self, temp_terraform_dir, variables, aws_region):
+        """Test creating a TerraformExecutionRequest with and without optional fields."""
         request = TerraformExecutionRequest(
             command='init',
             working_directory=temp_terraform_dir,
-            variables=None,
-            aws_region=None,
+            variables=variables,
+            aws_region=aws_region,
             strip_ansi=True,
         )
 
         assert request.command == 'init'
         assert request.working_directory == temp_terraform_dir
-        assert request.variables is None
-        assert request.aws_region is None
+        assert request.variables == variables
+        assert request.aws_region == aws_region
         assert request.strip_ansi is True
 
 
@@ -75,7 +73,7 @@ class TestTerraformExecutionResult:
             stderr='',
             command='terraform init',
             working_directory=temp_terraform_dir,
-            outputs={'instance_id': 'i-1234567890abcdef0'},
+            outputs=OUTPUTS,
         )
 
         assert result.status == 'success'
@@ -84,7 +82,7 @@ class TestTerraformExecutionResult:
         assert result.stderr == ''
         assert result.command == 'terraform init'
         assert result.working_directory == temp_terraform_dir
-        assert result.outputs == {'instance_id': 'i-1234567890abcdef0'}
+        assert result.outputs == OUTPUTS
         assert result.error_message is None
 
     def test_terraform_execution_result_error(self, temp_terraform_dir):
@@ -113,36 +111,25 @@ class TestTerraformExecutionResult:
 class TestCheckovScanRequest:
     """Tests for the CheckovScanRequest model."""
 
-    def test_checkov_scan_request_creation(self, temp_terraform_dir):
-        """Test creating a CheckovScanRequest."""
-        request = CheckovScanRequest(
-            working_directory=temp_terraform_dir,
-            framework='terraform',
-            check_ids=['CKV_AWS_1', 'CKV_AWS_2'],
-            skip_check_ids=['CKV_AWS_3'],
-            output_format='json',
-        )
-
-        assert request.working_directory == temp_terraform_dir
-        assert request.framework == 'terraform'
-        assert request.check_ids == ['CKV_AWS_1', 'CKV_AWS_2']
-        assert request.skip_check_ids == ['CKV_AWS_3']
-        assert request.output_format == 'json'
-
-    def test_checkov_scan_request_defaults(self, temp_terraform_dir):
-        """Test CheckovScanRequest with default values."""
+    @pytest.mark.parametrize(
+        'check_ids,skip_check_ids',
+        [(CHECK_IDS, SKIP_CHECK_IDS), (None, None)],
+        ids=['all_fields', 'defaults'],
+    )
+    def test_checkov_scan_request(self, temp_terraform_dir, check_ids, skip_check_ids):
+        """Test creating a CheckovScanRequest with and without check filters."""
         request = CheckovScanRequest(
             working_directory=temp_terraform_dir,
             framework='terraform',
-            check_ids=None,
-            skip_check_ids=None,
+            check_ids=check_ids,
+            skip_check_ids=skip_check_ids,
             output_format='json',
         )
 
         assert request.working_directory == temp_terraform_dir
         assert request.framework == 'terraform'
-        assert request.check_ids is None
-        assert request.skip_check_ids is None
+        assert request.check_ids == check_ids
+        assert request.skip_check_ids == skip_check_ids
         assert request.output_format == 'json'
 
 
@@ -1,6 +1,5 @@
 """Tests for the Terraform MCP server resources."""
 
-import pytest
 from awslabs.terraform_mcp_server.impl.resources.terraform_aws_provider_resources_listing import (
     terraform_aws_provider_assets_listing_impl,
 )
@@ -11,10 +10,6 @@ from pathlib import Path
 from unittest.mock import mock_open, patch
 
 
-pytestmark = pytest.mark.asyncio
-
-
-@pytest.mark.asyncio
 async def test_terraform_aws_provider_assets_listing_success():
     """Test the AWS provider resources listing with a mock file."""
     mock_content = """# AWS Provider Resources Listing
@@ -42,7 +37,6 @@ async def test_terraform_aws_provider_assets_listing_success():
             assert 'aws_instance' in result
 
 
-@pytest.mark.asyncio
 async def test_terraform_aws_provider_assets_listing_file_not_found():
     """Test the AWS provider resources listing when the file is not found."""
     # Mock the Path.exists method to return False
@@ -55,7 +49,6 @@ async def test_terraform_aws_provider_assets_listing_file_not_found():
         assert 'Static assets list file not found' in result
 
 
-@pytest.mark.asyncio
 async def test_terraform_aws_provider_assets_listing_exception():
     """Test the AWS provider resources listing when an exception occurs."""
     # Mock the Path.exists method to return True
@@ -70,7 +63,6 @@ async def test_terraform_aws_provider_assets_listing_exception():
             assert 'Test exception' in result
 
 
-@pytest.mark.asyncio
 async def test_terraform_awscc_provider_resources_listing_success():
     """Test the AWSCC provider resources listing with a mock file."""
     mock_content = """# AWSCC Provider Resources Listing
@@ -98,7 +90,6 @@ async def test_terraform_awscc_provider_resources_listing_success():
             assert 'awscc_ec2_instance' in result
 
 
-@pytest.mark.asyncio
 async def test_terraform_awscc_provider_resources_listing_file_not_found():
     """Test the AWSCC provider resources listing when the file is not found."""
     # Mock the Path.exists method to return False
@@ -111,7 +102,6 @@ async def test_terraform_awscc_provider_resources_listing_file_not_found():
         assert 'Static assets list file not found' in result
 
 
-@pytest.mark.asyncio
 async def test_terraform_awscc_provider_resources_listing_exception():
     """Test the AWSCC provider resources listing when an exception occurs."""
     # Mock the Path.exists method to return True
@@ -2,39 +2,36 @@
 
 import json
 import os
-import pytest
+import subprocess
 from awslabs.terraform_mcp_server.impl.tools.run_checkov_scan import (
-    _clean_output_text,
     _parse_checkov_json_output,
     run_checkov_scan_impl,
 )
+from awslabs.terraform_mcp_server.impl.tools.utils import clean_output_text
 from awslabs.terraform_mcp_server.models.models import CheckovScanRequest
 from unittest.mock import MagicMock, patch
 
 
-pytestmark = pytest.mark.asyncio
-
-
 def test_clean_output_text_function():
-    """Test the _clean_output_text function directly."""
+    """Test the clean_output_text function directly."""
     # Test with ANSI escape sequences
     ansi_text = '\x1b[31mError\x1b[0m: Something went wrong'
-    cleaned_text = _clean_output_text(ansi_text)
+    cleaned_text = clean_output_text(ansi_text)
     assert cleaned_text == 'Error: Something went wrong'
 
     # Test with control characters
     control_text = 'Line 1\x0bLine 2\x0cLine 3'
-    cleaned_text = _clean_output_text(control_text)
+    cleaned_text = clean_output_text(control_text)
     assert cleaned_text == 'Line 1Line 2Line 3'
 
     # Test with HTML entities
     html_text = 'This -&gt; that &lt;tag&gt; &amp; more'
-    cleaned_text = _clean_output_text(html_text)
+    cleaned_text = clean_output_text(html_text)
     assert cleaned_text == 'This -> that <tag> & more'
 
     # Test with Unicode box-drawing characters
     unicode_text = '┌───┐\n│ABC│\n└───┘'
-    cleaned_text = _clean_output_text(unicode_text)
+    cleaned_text = clean_output_text(unicode_text)
     assert 'ABC' in cleaned_text
     # Check that box-drawing characters are replaced with ASCII equivalents
     assert '+' in cleaned_text  # ┌ and ┘ should be replaced with +
@@ -43,13 +40,12 @@ def test_clean_output_text_function():
 
     # Test with None input - should handle it gracefully
     # Since the function expects a string, we'll test with empty string instead
-    assert _clean_output_text('') == ''
+    assert clean_output_text('') == ''
 
     # Test with empty string
-    assert _clean_output_text('') == ''
+    assert clean_output_text('') == ''
 
 
-@pytest.mark.asyncio
 async def test_parse_checkov_json_output_valid():
     """Test parsing valid Checkov JSON output."""
     # Create a valid JSON output
@@ -107,7 +103,6 @@ async def test_parse_checkov_json_output_valid():
     assert summary['skipped'] == 0
 
 
-@pytest.mark.asyncio
 async def test_parse_checkov_json_output_invalid():
     """Test parsing invalid Checkov JSON output."""
     # Test with invalid JSON
@@ -130,7 +125,6 @@ async def test_parse_checkov_json_output_invalid():
     assert summary['failed'] == 0
 
 
-@pytest.mark.asyncio
 async def test_run_checkov_scan_with_absolute_path(temp_terraform_dir):
     """Test running Checkov scan with an absolute path."""
     # Create the request with an absolute path and all required parameters
@@ -167,7 +161,39 @@ async def test_run_checkov_scan_with_absolute_path(temp_terraform_dir):
             assert result.summary['failed'] == 0
 
 
-@pytest.mark.asyncio
+async def test_run_checkov_scan_command_flags(temp_terraform_dir, checkov_scan_request):
+    """Test that only the optional Checkov flags with a value are passed on the command line."""
+    request = checkov_scan_request.model_copy(
+        update={'check_ids': ['CKV_AWS_1', 'CKV_AWS_2'], 'skip_check_ids': []}
+    )
+
+    mock_result = MagicMock()
+    mock_result.returncode = 0
+    mock_result.stdout = json.dumps({'results': {'failed_checks': []}, 'summary': {}})
+    mock_result.stderr = ''
+
+    with patch('subprocess.run', return_value=mock_result) as mock_run:
+        with patch(
+            'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan._ensure_checkov_installed',
+            return_value=True,
+        ):
+            await run_checkov_scan_impl(request)
+
+    assert mock_run.call_args.args[0] == [
+        'checkov',
+        '--quiet',
+        '-d',
+        temp_terraform_dir,
+        '--framework',
+        'terraform',
+        '--check',
+        'CKV_AWS_1,CKV_AWS_2',
+        '--output',
+        'json',
+    ]
+    assert mock_run.call_args.kwargs['stdin'] is subprocess.DEVNULL
+
+
 async def test_run_checkov_scan_with_relative_path(temp_terraform_dir):
     """Test running Checkov scan with a relative path."""
     # Create a relative path (just the directory name)
@@ -208,20 +234,18 @@ async def test_run_checkov_scan_with_relative_path(temp_terraform_dir):
                         assert result.summary['passed'] == 3
 
 
-@pytest.mark.asyncio
-async def test_run_checkov_scan_with_skip_check_ids_dangerous_pattern(temp_terraform_dir):
+async def test_run_checkov_scan_with_skip_check_ids_dangerous_pattern(checkov_scan_request):
     """Test running Checkov scan with dangerous patterns in skip_check_ids."""
     # Create the request with dangerous patterns in skip_check_ids and all required parameters
-    request = CheckovScanRequest(
-        working_directory=temp_terraform_dir,
-        framework='terraform',
-        output_format='json',
-        check_ids=None,
-        skip_check_ids=['CKV_AWS_1; rm -rf /'],  # Dangerous pattern
-    )
+    request = checkov_scan_request.model_copy(update={'skip_check_ids': ['CKV_AWS_1; rm -rf /']})
 
-    # Call the function
-    result = await run_checkov_scan_impl(request)
+    # Call the function; the request is rejected before Checkov is installed
+    with patch(
+        'awslabs.terraform_mcp_server.impl.tools.run_checkov_scan._ensure_checkov_installed'
+    ) as mock_ensure:
+        result = await run_checkov_scan_impl(request)
+
+    mock_ensure.assert_not_called()
 
     # Check the result
     assert result.status == 'error'
@@ -230,17 +254,10 @@ async def test_run_checkov_scan_with_skip_check_ids_dangerous_pattern(temp_terra
     assert 'Potentially dangerous pattern' in result.error_message
 
 
-@pytest.mark.asyncio
-async def test_run_checkov_scan_cli_output_parsing(temp_terraform_dir):
+async def test_run_checkov_scan_cli_output_parsing(temp_terraform_dir, checkov_scan_request):
     """Test running Checkov scan with CLI output format and parsing the results."""
     # Create the request with all required parameters
-    request = CheckovScanRequest(
-        working_directory=temp_terraform_dir,
-        framework='terraform',
-        output_format='cli',
-        check_ids=None,
-        skip_check_ids=None,
-    )
+    request = checkov_scan_request.model_copy(update={'output_format': 'cli'})
 
     # Create a mock subprocess.run result with CLI output
     mock_result = MagicMock()
@@ -284,17 +301,10 @@ async def test_run_checkov_scan_cli_output_parsing(temp_terraform_dir):
             assert result.summary['skipped'] == 1
 
 
-@pytest.mark.asyncio
-async def test_run_checkov_scan_with_return_code_2(temp_terraform_dir):
+async def test_run_checkov_scan_with_return_code_2(checkov_scan_request):
     """Test running Checkov scan with return code 2 (error)."""
     # Create the request with all required parameters
-    request = CheckovScanRequest(
-        working_directory=temp_terraform_dir,
-        framework='terraform',
-        output_format='json',
-        check_ids=None,
-        skip_check_ids=None,
-    )
+    request = checkov_scan_request
 
     # Create a mock subprocess.run result with error
     mock_result = MagicMock()
@@ -317,17 +327,10 @@ async def test_run_checkov_scan_with_return_code_2(temp_terraform_dir):
             assert len(result.vulnerabilities) == 0
 
 
-@pytest.mark.asyncio
-async def test_run_checkov_scan_exception_handling(temp_terraform_dir):
+async def test_run_checkov_scan_exception_handling(temp_terraform_dir, checkov_scan_request):
     """Test running Checkov scan with exception handling."""
     # Create the request with all required parameters
-    request = CheckovScanRequest(
-        working_directory=temp_terraform_dir,
-        framework='terraform',
-        output_format='json',
-        check_ids=None,
-        skip_check_ids=None,
-    )
+    request = checkov_scan_request
 
     # Mock subprocess.run to raise an exception
     with patch('subprocess.run', side_effect=Exception('Command execution failed')):
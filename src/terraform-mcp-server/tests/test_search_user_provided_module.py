@@ -20,9 +20,6 @@ from unittest.mock import patch
 from urllib.parse import urlparse
 
 
-pytestmark = pytest.mark.asyncio
-
-
 # Configure logger for enhanced diagnostics with stacktraces
 logger.configure(
     handlers=[
@@ -12,7 +12,6 @@
 """Tests for the server module of the terraform-mcp-server."""
 
 import os
-import pytest
 import tempfile
 from awslabs.terraform_mcp_server.models import (
     CheckovScanResult,
@@ -71,7 +70,6 @@ class TestTools:
         assert tool.name == 'ExecuteTerraformCommand'
         assert 'Execute Terraform workflow commands' in tool.description
 
-    @pytest.mark.asyncio
     @patch('awslabs.terraform_mcp_server.server.execute_terraform_command_impl')
     async def test_execute_terraform_command(self, mock_execute_terraform_command_impl):
         """Test the execute_terraform_command function."""
@@ -127,7 +125,6 @@ class TestTools:
         assert tool.name == 'SearchAwsProviderDocs'
         assert 'Search AWS provider documentation' in tool.description
 
-    @pytest.mark.asyncio
     @patch('awslabs.terraform_mcp_server.server.search_aws_provider_docs_impl')
     async def test_search_aws_provider_docs(self, mock_search_aws_provider_docs_impl):
         """Test the search_aws_provider_docs function."""
@@ -171,7 +168,6 @@ class TestTools:
         assert tool.name == 'SearchAwsccProviderDocs'
         assert 'Search AWSCC provider documentation' in tool.description
 
-    @pytest.mark.asyncio
     @patch('awslabs.terraform_mcp_server.server.search_awscc_provider_docs_impl')
     async def test_search_awscc_provider_docs(self, mock_search_awscc_provider_docs_impl):
         """Test the search_awscc_provider_docs function."""
@@ -214,7 +210,6 @@ class TestTools:
         assert tool.name == 'SearchSpecificAwsIaModules'
         assert 'Search for specific AWS-IA Terraform modules' in tool.description
 
-    @pytest.mark.asyncio
     @patch('awslabs.terraform_mcp_server.server.search_specific_aws_ia_modules_impl')
     async def test_search_specific_aws_ia_modules(self, mock_search_specific_aws_ia_modules_impl):
         """Test the search_specific_aws_ia_modules function."""
@@ -254,7 +249,6 @@ class TestTools:
         assert tool.name == 'RunCheckovScan'
         assert 'Run Checkov security scan' in tool.description
 
-    @pytest.mark.asyncio
     @patch('awslabs.terraform_mcp_server.server.run_checkov_scan_impl')
     async def test_run_checkov_scan(self, mock_run_checkov_scan_impl):
         """Test the run_checkov_scan function."""
@@ -322,7 +316,6 @@ class TestTools:
         assert tool.name == 'SearchUserProvidedModule'
         assert 'Search for a user-provided Terraform registry module' in tool.description
 
-    @pytest.mark.asyncio
     @patch('awslabs.terraform_mcp_server.server.search_user_provided_module_impl')
     async def test_search_user_provided_module(self, mock_search_user_provided_module_impl):
         """Test the search_user_provided_module function."""
@@ -439,7 +432,6 @@ class TestResources:
         )
         assert resource_info.mime_type == 'text/markdown'
 
-    @pytest.mark.asyncio
     @patch('awslabs.terraform_mcp_server.server.TERRAFORM_WORKFLOW_GUIDE', 'Test workflow guide')
     async def test_terraform_development_workflow_content(self):
         """Test the terraform_development_workflow resource content."""
@@ -451,7 +443,6 @@ class TestResources:
         # Verify the result
         assert result == 'Test workflow guide'
 
-    @pytest.mark.asyncio
     async def test_terraform_aws_provider_resources_listing_resource(self):
         """Test the terraform_aws_provider_resources_listing resource."""
         # Call the function
@@ -461,7 +452,6 @@ class TestResources:
         assert isinstance(result, str)
         assert 'AWS Provider Resources' in result
 
-    @pytest.mark.asyncio
     async def test_terraform_awscc_provider_resources_listing_resource(self):
         """Test the terraform_awscc_provider_resources_listing resource."""
         # Call the function
@@ -484,7 +474,6 @@ class TestResources:
         )
         assert resource_info.mime_type == 'text/markdown'
 
-    @pytest.mark.asyncio
     @patch(
         'awslabs.terraform_mcp_server.server.AWS_TERRAFORM_BEST_PRACTICES', 'Test best practices'
     )
@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-import pytest
 import sys
 from awslabs.terraform_mcp_server.impl.tools.search_aws_provider_docs import (
     search_aws_provider_docs_impl,
@@ -17,9 +16,6 @@ from loguru import logger
 from typing import Any
 
 
-pytestmark = pytest.mark.asyncio
-
-
 # Configure logger for enhanced diagnostics with stacktraces
 logger.configure(
     handlers=[
@@ -1,6 +1,5 @@
 """Additional tests for the utils module of the terraform-mcp-server."""
 
-import pytest
 from awslabs.terraform_mcp_server.impl.tools.utils import (
     get_github_release_details,
     get_submodules,
@@ -10,13 +9,9 @@ from awslabs.terraform_mcp_server.models import TerraformVariable
 from unittest.mock import MagicMock, patch
 
 
-pytestmark = pytest.mark.asyncio
-
-
 class TestGetGithubReleaseDetails:
     """Tests for the get_github_release_details function."""
 
-    @pytest.mark.asyncio
     async def test_get_github_release_details_with_latest_release(self):
         """Test getting GitHub release details with a latest release."""
         # Mock the requests.get function
@@ -43,7 +38,6 @@ class TestGetGithubReleaseDetails:
             assert result['details']['tag_name'] == 'v1.0.0'
             assert result['details']['published_at'] == '2023-01-01T00:00:00Z'
 
-    @pytest.mark.asyncio
     async def test_get_github_release_details_with_tags(self):
         """Test getting GitHub release details with tags when no releases are found."""
         # Mock the requests.get function
@@ -94,7 +88,6 @@ class TestGetGithubReleaseDetails:
             assert result['details']['tag_name'] == 'v0.9.0'
             assert result['details']['published_at'] is None
 
-    @pytest.mark.asyncio
     async def test_get_github_release_details_with_no_releases_or_tags(self):
         """Test getting GitHub release details with no releases or tags."""
         # Mock the requests.get function
@@ -129,7 +122,6 @@ class TestGetGithubReleaseDetails:
             assert result['version'] == ''
             assert result['details'] == {}
 
-    @pytest.mark.asyncio
     async def test_get_github_release_details_with_exception(self):
         """Test getting GitHub release details with an exception."""
         # Mock the requests.get function to raise an exception
@@ -145,7 +137,6 @@ class TestGetGithubReleaseDetails:
 class TestGetSubmodules:
     """Tests for the get_submodules function."""
 
-    @pytest.mark.asyncio
     async def test_get_submodules_with_submodules(self):
         """Test getting submodules with submodules."""
         # Mock the requests.get function
@@ -225,7 +216,6 @@ module "submodule1" {
             assert result[1].name == 'submodule2'
             assert result[1].path == 'modules/submodule2'
 
-    @pytest.mark.asyncio
     async def test_get_submodules_with_no_modules_directory(self):
         """Test getting submodules with no modules directory."""
         # Mock the requests.get function
@@ -248,7 +238,6 @@ module "submodule1" {
             # Check the result
             assert len(result) == 0
 
-    @pytest.mark.asyncio
     async def test_get_submodules_with_rate_limit(self):
         """Test getting submodules with a rate limit error."""
         # Mock the requests.get function
@@ -271,7 +260,6 @@ module "submodule1" {
             # Check the result
             assert len(result) == 0
 
-    @pytest.mark.asyncio
     async def test_get_submodules_with_exception(self):
         """Test getting submodules with an exception."""
         # Mock the requests.get function to raise an exception
@@ -286,7 +274,6 @@ module "submodule1" {
 class TestGetVariablesTf:
     """Tests for the get_variables_tf function."""
 
-    @pytest.mark.asyncio
     async def test_get_variables_tf_with_variables(self):
         """Test getting variables.tf with variables."""
         # Mock the requests.get function
@@ -355,7 +342,6 @@ variable "instance_type" {
                 assert variables[1].default is None
                 assert variables[1].required is True
 
-    @pytest.mark.asyncio
     async def test_get_variables_tf_with_no_variables_tf(self):
         """Test getting variables.tf with no variables.tf file."""
         # Mock the requests.get function
@@ -395,7 +381,6 @@ variable "instance_type" {
             assert content is None
             assert variables is None
 
-    @pytest.mark.asyncio
     async def test_get_variables_tf_with_master_branch_fallback(self):
         """Test getting variables.tf from the master branch as fallback."""
         # Mock the requests.get function
@@ -464,7 +449,6 @@ variable "region" {
                 assert variables[0].default == 'us-west-2'
                 assert variables[0].required is False
 
-    @pytest.mark.asyncio
     async def test_get_variables_tf_with_exception(self):
         """Test getting variables.tf with an exception."""
         # Mock the requests.get function to raise an exception